@@ -29,6 +29,7 @@ from azcore.agents.enhanced_agent import (
 from azcore.nodes.coordinator import CoordinatorNode
 from azcore.nodes.planner import PlannerNode
 from azcore.nodes.generator import ResponseGeneratorNode
+from azcore.nodes.fused_router import FusedRouterNode, create_fused_router
 
 # Advanced Planning & Reasoning Features
 from azcore.nodes.advanced_planner import (
@@ -136,6 +137,8 @@ __all__ = [
     "CoordinatorNode",
     "PlannerNode",
     "ResponseGeneratorNode",
+    "FusedRouterNode",
+    "create_fused_router",
     
     # Advanced Planning Nodes
     "AdvancedPlannerNode",
@@ -30,6 +30,9 @@ from azcore.agents.agent_pattern_router import (
 # Agent Routing & Handoffs
 from azcore.agents.agent_router import AgentRouter, HandoffAgent
 
+# Two-Stage Tool Selection
+from azcore.agents.tool_selector import ToolSelector
+
 # Agent Registry (NEW)
 from azcore.agents.agent_registry import (
     AgentRegistry,
@@ -65,6 +68,9 @@ __all__ = [
     # Agent Routing & Handoffs
     "AgentRouter",
     "HandoffAgent",
+
+    # Two-Stage Tool Selection
+    "ToolSelector",
     
     # Agent Registry (NEW)
     "AgentRegistry",
@@ -5,7 +5,8 @@ This module provides a factory pattern for creating various agent types
 with consistent configuration and behavior.
 """
 
-from typing import Sequence, Optional, Dict, Any, Union
+import asyncio
+from typing import Sequence, Optional, Dict, Any, List, Union
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from azcore.core.agent_executor import create_thinkat_agent
@@ -45,11 +46,12 @@ class ReactAgent(BaseAgent):
         rl_manager: Optional['RLManager'] = None,
         reward_calculator: Optional['RewardCalculator'] = None,
         enable_caching: bool = True,
-        cache_type: str = "exact"
+        cache_type: str = "exact",
+        rl_confidence_threshold: float = 0.9
     ):
         """
         Initialize a ReAct agent.
-        
+
         Args:
             name: Unique identifier for the agent
             llm: Language model (will be wrapped with caching if enable_caching=True)
@@ -61,6 +63,9 @@ class ReactAgent(BaseAgent):
             reward_calculator: Optional reward calculator
             enable_caching: Enable LLM response caching
             cache_type: Cache type ("exact" or "semantic")
+            rl_confidence_threshold: Softmax confidence above which the
+                RL policy's greedy action is used directly, skipping the
+                full exploration/selection machinery
         """
         # Wrap LLM with caching if enabled and not already cached
         if enable_caching and not isinstance(llm, CachedLLM):
@@ -73,6 +78,7 @@ class ReactAgent(BaseAgent):
         self.rl_enabled = rl_enabled and RL_AVAILABLE
         self.rl_manager = rl_manager
         self.reward_calculator = reward_calculator
+        self.rl_confidence_threshold = rl_confidence_threshold
         self._all_tools = list(tools) if tools else []
         
         if self.rl_enabled and not self.rl_manager:
@@ -84,8 +90,15 @@ class ReactAgent(BaseAgent):
             tools=self.tools,
             prompt=prompt
         )
-        
-    
+
+        # Executor instances per RL-selected tool subset: rebuilding the
+        # underlying agent on every invoke is the dominant fixed cost of
+        # RL tool selection, and the distinct subsets a policy produces
+        # are few, so each is constructed once and reused
+        self._agent_by_toolset: Dict[tuple, Any] = {
+            tuple(sorted(t.name for t in self.tools)): self._agent
+        }
+
         self._logger.info(
             f"Created ReactAgent '{name}' with {len(self.tools)} tools"
             + (f", RL enabled" if self.rl_enabled else "")
@@ -122,20 +135,46 @@ class ReactAgent(BaseAgent):
         
         # Extract query from state
         query = self._extract_query_from_state(state)
-        
-        # Get RL-recommended tools
-        selected_tool_names, state_key = self.rl_manager.select_tools(query)
+
+        # Fast path: when the policy has converged and is confident about
+        # a single tool for this exact state, use it directly and skip
+        # the exploration/similarity-search machinery
+        # Probe without bookkeeping: select_tools() counts the visit
+        # itself on the slow path, so recording here too would count
+        # every selection round twice
+        best_tool, confidence = self.rl_manager.select_action_with_confidence(
+            query, record_visit=False
+        )
+        if (
+            best_tool is not None
+            and confidence >= self.rl_confidence_threshold
+            and self.rl_manager.exploration_rate <= 0.05
+        ):
+            selected_tool_names, state_key = [best_tool], query
+            self.rl_manager.record_state_visit(state_key)
+            self._logger.info(
+                f"RL confident ({confidence:.2f}) - using greedy tool '{best_tool}'"
+            )
+        else:
+            # Get RL-recommended tools
+            selected_tool_names, state_key = self.rl_manager.select_tools(query)
         
         # Filter tools
         selected_tools = [t for t in self._all_tools if t.name in selected_tool_names]
-        
-        # Update agent with selected tools
+
+        # Update agent with selected tools, reusing the executor built
+        # for this exact tool subset when one exists
         self.tools = selected_tools
-        self._agent = create_thinkat_agent(
-            model=self.llm,
-            tools=self.tools,
-            prompt=self.prompt
-        )
+        toolset_key = tuple(sorted(t.name for t in selected_tools))
+        agent = self._agent_by_toolset.get(toolset_key)
+        if agent is None:
+            agent = create_thinkat_agent(
+                model=self.llm,
+                tools=self.tools,
+                prompt=self.prompt
+            )
+            self._agent_by_toolset[toolset_key] = agent
+        self._agent = agent
         
         # Store RL metadata in state
         rl_metadata = state.get("rl_metadata", {})
@@ -209,6 +248,71 @@ class ReactAgent(BaseAgent):
         
         return result
     
+    async def abatch(
+        self,
+        states: List[Dict[str, Any]],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Invoke the agent over many independent states concurrently.
+
+        Each state runs through the normal ainvoke path (including RL
+        tool selection and reward updates) with a semaphore capping
+        in-flight requests, so N queries overlap their LLM round-trips
+        instead of running serially.
+
+        Args:
+            states: Workflow states to process
+            max_concurrency: Maximum invocations in flight at once
+            return_exceptions: Return exceptions as results instead of
+                failing the whole batch on the first error
+
+        Returns:
+            List of results in the same order as the states
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_one(state: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.ainvoke(state)
+
+        self._logger.info(
+            f"ReactAgent '{self.name}' batching {len(states)} states "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+        return await asyncio.gather(
+            *(_run_one(state) for state in states),
+            return_exceptions=return_exceptions
+        )
+
+    def batch(
+        self,
+        states: List[Dict[str, Any]],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around abatch for non-async callers.
+
+        Args:
+            states: Workflow states to process
+            max_concurrency: Maximum invocations in flight at once
+            return_exceptions: Return exceptions as results instead of
+                failing the whole batch on the first error
+
+        Returns:
+            List of results in the same order as the states
+        """
+        return asyncio.run(
+            self.abatch(
+                states,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions
+            )
+        )
+
     def stream(self, state: Dict[str, Any]):
         """
         Stream agent responses.
@@ -265,8 +369,9 @@ class AgentFactory:
         """
         self.default_llm = default_llm
         self.default_tools = list(default_tools) if default_tools else []
+        self._agent_cache: Dict[tuple, ReactAgent] = {}
         self._logger = logging.getLogger(self.__class__.__name__)
-        
+
         self._logger.info("AgentFactory initialized")
     
     def create_react_agent(
@@ -333,6 +438,88 @@ class AgentFactory:
         
         return agent
     
+    def get_or_create_react_agent(
+        self,
+        name: str,
+        llm: Optional[Union[BaseChatModel, CachedLLM]] = None,
+        tools: Optional[Sequence[BaseTool]] = None,
+        prompt: Optional[str] = None,
+        description: str = "",
+        rl_enabled: bool = False,
+        rl_manager: Optional['RLManager'] = None,
+        reward_calculator: Optional['RewardCalculator'] = None,
+        enable_caching: bool = True,
+        cache_type: str = "exact"
+    ) -> ReactAgent:
+        """
+        Get a cached ReAct agent or create one if no equivalent exists.
+
+        Building a ReactAgent compiles a fresh LangGraph executor, which
+        is wasteful when the same (LLM, tools, prompt) combination is
+        requested repeatedly - e.g. when a driver script reconstructs its
+        teams for every query. Agents are cached on that combination; on
+        a cache hit only the RL manager and reward calculator references
+        are refreshed, and no graph is recompiled.
+
+        Args:
+            name: Agent name
+            llm: Language model (uses default if not provided)
+            tools: Tools for the agent (uses default if not provided)
+            prompt: System prompt
+            description: Agent description
+            rl_enabled: Enable RL-based tool selection
+            rl_manager: Optional RLManager instance
+            reward_calculator: Optional reward calculator
+            enable_caching: Enable LLM response caching
+            cache_type: Cache type ("exact" or "semantic")
+
+        Returns:
+            ReactAgent instance (possibly shared with earlier callers)
+        """
+        agent_llm = llm or self.default_llm
+        agent_tools = list(tools) if tools else self.default_tools
+
+        cache_key = (
+            name,
+            id(agent_llm),
+            tuple(sorted(t.name for t in agent_tools)),
+            hash(prompt),
+            rl_enabled,
+            enable_caching,
+            cache_type
+        )
+
+        cached_agent = self._agent_cache.get(cache_key)
+        if cached_agent is not None:
+            # Refresh the mutable collaborators without rebuilding
+            if rl_manager is not None:
+                cached_agent.rl_manager = rl_manager
+            if reward_calculator is not None:
+                cached_agent.reward_calculator = reward_calculator
+            self._logger.debug(f"Reusing cached ReactAgent '{name}'")
+            return cached_agent
+
+        agent = self.create_react_agent(
+            name=name,
+            llm=llm,
+            tools=tools,
+            prompt=prompt,
+            description=description,
+            rl_enabled=rl_enabled,
+            rl_manager=rl_manager,
+            reward_calculator=reward_calculator,
+            enable_caching=enable_caching,
+            cache_type=cache_type
+        )
+        self._agent_cache[cache_key] = agent
+
+        return agent
+
+    def clear_agent_cache(self) -> None:
+        """Clear the cached agents (e.g. after changing defaults)."""
+        self._agent_cache.clear()
+        self._logger.info("Cleared agent cache")
+
     def create_custom_agent(
         self,
         agent_class: type,
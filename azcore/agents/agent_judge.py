@@ -6,10 +6,13 @@ The AgentJudge acts as a quality control mechanism, providing objective assessme
 and feedback on various types of content, decisions, or outputs.
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from azcore.agents.agent_factory import ReactAgent
 from azcore.core.base import BaseAgent
+from azcore.utils.caching import SemanticCache
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.tools import BaseTool
 
@@ -130,6 +133,9 @@ class AgentJudge(BaseAgent):
         max_loops: int = 1,
         evaluation_criteria: Optional[Dict[str, float]] = None,
         return_score: bool = False,
+        enable_cache: bool = False,
+        cache_embedding_function: Optional[Callable] = None,
+        cache_similarity_threshold: float = 0.95,
         **kwargs,
     ):
         """
@@ -144,6 +150,13 @@ class AgentJudge(BaseAgent):
             max_loops (int): Maximum evaluation iterations
             evaluation_criteria (Optional[Dict[str, float]]): Custom criteria with weights
             return_score (bool): Whether to return score instead of text
+            enable_cache (bool): Cache evaluations so repeated judgments of
+                identical or semantically similar content skip the LLM
+                round-trip (exact repeats hit a plain dict lookup first)
+            cache_embedding_function (Optional[Callable]): Embedding function
+                for the semantic tier (without it only exact repeats hit)
+            cache_similarity_threshold (float): Minimum cosine similarity
+                for a semantic cache hit (default: 0.95)
         """
         # Enhance prompt with evaluation criteria if provided
         enhanced_prompt = prompt
@@ -164,7 +177,35 @@ class AgentJudge(BaseAgent):
         self.max_loops = max_loops
         self.evaluation_criteria = evaluation_criteria or {}
         self.return_score = return_score
-        
+
+        # Criteria are fixed for the lifetime of the judge, so the task
+        # suffix and the serialized form used for cache keys are built
+        # once here instead of on every invoke. Keeping the suffix
+        # byte-for-byte stable across calls also lets provider-side
+        # prompt caching reuse the static portion of the prompt.
+        self._criteria_suffix = ""
+        if self.evaluation_criteria:
+            criteria_str = "\n\nPlease use these specific evaluation criteria:\n"
+            for criterion, weight in self.evaluation_criteria.items():
+                criteria_str += f"- {criterion}: weight = {weight}\n"
+            self._criteria_suffix = criteria_str
+        self._criteria_json = json.dumps(self.evaluation_criteria, sort_keys=True)
+
+        # Optional semantic cache over finished evaluations: repeated
+        # judgments of (near-)identical content under the same criteria
+        # reuse the cached verdict instead of a fresh LLM round-trip
+        self.enable_cache = enable_cache
+        self._eval_cache: Optional[SemanticCache] = None
+        # Tier-0 exact-match memo consulted before the semantic tier:
+        # identical (criteria, content) repeats are served with a dict
+        # lookup, no embedding computation needed
+        self._exact_cache: Dict[str, str] = {}
+        if enable_cache:
+            self._eval_cache = SemanticCache(
+                embedding_function=cache_embedding_function,
+                similarity_threshold=cache_similarity_threshold
+            )
+
         # Create the evaluation agent
         self.agent = ReactAgent(
             name=f"{name}-evaluator",
@@ -195,15 +236,23 @@ class AgentJudge(BaseAgent):
 
         logger.info(f"Evaluating content: {content[:100]}...")
 
-        # Build evaluation task
-        task = EVALUATION_TASK_PROMPT.format(outputs=content)
-        
-        # Add criteria if provided
-        if self.evaluation_criteria:
-            criteria_str = "\n\nPlease use these specific evaluation criteria:\n"
-            for criterion, weight in self.evaluation_criteria.items():
-                criteria_str += f"- {criterion}: weight = {weight}\n"
-            task += criteria_str
+        # Serve from the evaluation cache when possible
+        cache_query = None
+        if self.enable_cache:
+            cache_query = self._cache_query(content)
+            cached_evaluation = self._exact_cache.get(cache_query)
+            if cached_evaluation is None and self._eval_cache is not None:
+                cached_evaluation = self._eval_cache.get(cache_query)
+            if cached_evaluation is not None:
+                logger.info("Judge cache hit - reusing prior evaluation")
+                return self._build_result(
+                    state,
+                    cached_evaluation,
+                    [{"role": "evaluator", "content": cached_evaluation}]
+                )
+
+        # Build evaluation task (criteria suffix precomputed in __init__)
+        task = EVALUATION_TASK_PROMPT.format(outputs=content) + self._criteria_suffix
 
         # Perform evaluation
         conversation = []
@@ -236,7 +285,25 @@ class AgentJudge(BaseAgent):
         # Get final evaluation
         final_evaluation = conversation[-1]["content"] if conversation else ""
 
-        # Return score or text based on configuration
+        # Remember the verdict for future repeats in both tiers
+        if self.enable_cache and final_evaluation:
+            self._exact_cache[cache_query] = final_evaluation
+            if self._eval_cache is not None:
+                self._eval_cache.put(cache_query, final_evaluation)
+
+        return self._build_result(state, final_evaluation, conversation)
+
+    def _cache_query(self, content: str) -> str:
+        """Build the cache lookup text from criteria plus normalized content."""
+        return f"{self._criteria_json}\n{content.strip().lower()}"
+
+    def _build_result(
+        self,
+        state: Dict[str, Any],
+        final_evaluation: str,
+        conversation: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Assemble the result state for a finished evaluation."""
         if self.return_score:
             score = get_reward(final_evaluation)
             return {
@@ -257,13 +324,88 @@ class AgentJudge(BaseAgent):
         """
         Asynchronously execute the evaluation process.
 
+        The synchronous evaluation is offloaded to a worker thread so
+        concurrent evaluations (e.g. aevaluate_batch) overlap their LLM
+        round-trips instead of blocking the event loop.
+
         Args:
             state (Dict[str, Any]): Current workflow state
 
         Returns:
             Dict[str, Any]: Updated state
         """
-        return self.invoke(state)
+        return await asyncio.to_thread(self.invoke, state)
+
+    def stream_evaluation(
+        self,
+        state: Dict[str, Any],
+        max_chars: Optional[int] = None
+    ):
+        """
+        Stream the evaluation text, optionally stopping early.
+
+        Callers that only display a truncated verdict (dashboards, smoke
+        checks) should not pay for a full evaluation: output tokens are
+        billed as generated, so closing the stream once max_chars have
+        arrived cuts both cost and time-to-first-feedback. The underlying
+        stream is closed on early exit so the HTTP connection is released.
+
+        Args:
+            state (Dict[str, Any]): Current workflow state
+            max_chars (Optional[int]): Stop streaming once this many
+                characters have been yielded; None streams to completion
+
+        Yields:
+            str: Evaluation text chunks
+        """
+        content = ""
+        if "messages" in state:
+            for msg in state["messages"]:
+                if msg.get("role") == "user":
+                    content = msg.get("content", "")
+                    break
+
+        task = EVALUATION_TASK_PROMPT.format(outputs=content) + self._criteria_suffix
+        messages = [
+            {"role": "system", "content": self.prompt},
+            {"role": "user", "content": task},
+        ]
+
+        stream = self.llm.stream(messages)
+        total = 0
+        try:
+            for chunk in stream:
+                piece = chunk.content
+                if not piece:
+                    continue
+                yield piece
+                total += len(piece)
+                if max_chars is not None and total >= max_chars:
+                    logger.debug(
+                        "Stopping evaluation stream early at %d chars", total
+                    )
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+
+    def evaluate_preview(
+        self,
+        state: Dict[str, Any],
+        max_chars: int = 250
+    ) -> str:
+        """
+        Get a truncated evaluation without generating the full text.
+
+        Args:
+            state (Dict[str, Any]): Current workflow state
+            max_chars (int): Approximate maximum evaluation length
+
+        Returns:
+            str: The accumulated evaluation text
+        """
+        return "".join(self.stream_evaluation(state, max_chars=max_chars))
 
     def _format_conversation(self, conversation: List[Dict[str, str]]) -> str:
         """Format conversation history as a string."""
@@ -289,3 +431,148 @@ class AgentJudge(BaseAgent):
             result = self.invoke(state)
             results.append(result)
         return results
+
+    def evaluate_batch_grouped(
+        self, states: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate multiple outputs with a single grouped judge call.
+
+        evaluate_batch pays the system prompt, criteria and a full LLM
+        round-trip per state. Here all outputs are concatenated into one
+        prompt asking the judge to return a JSON list with one verdict
+        per response, so the shared prompt tokens are paid once and wall
+        time collapses to a single round-trip. If the grouped response
+        cannot be parsed, the per-item path is used as a fallback.
+
+        Args:
+            states (List[Dict[str, Any]]): List of states to evaluate
+
+        Returns:
+            List[Dict[str, Any]]: Evaluation results in input order
+        """
+        if not states:
+            return []
+        if len(states) == 1:
+            return [self.invoke(states[0])]
+
+        contents = []
+        for state in states:
+            content = ""
+            for msg in state.get("messages", []):
+                if msg.get("role") == "user":
+                    content = msg.get("content", "")
+                    break
+            contents.append(content)
+
+        batched = "\n\n".join(
+            f"[Response {i + 1}]\n{content}"
+            for i, content in enumerate(contents)
+        )
+        task = (
+            "Evaluate each of the following responses independently. "
+            "Return ONLY a JSON list with one object per response, of the "
+            'form {"id": <response number>, "evaluation": "<critique>"}.'
+            f"{self._criteria_suffix}\n\n{batched}"
+        )
+
+        logger.info("Evaluating %d outputs in one grouped judge call", len(states))
+
+        result = self.agent.invoke(
+            {"messages": [{"role": "user", "content": task}]}
+        )
+        evaluation = ""
+        for msg in reversed(result.get("messages", [])):
+            if msg.get("role") == "assistant":
+                evaluation = msg.get("content", "")
+                break
+
+        verdicts = self._parse_grouped_verdicts(evaluation, len(states))
+        if verdicts is None:
+            logger.warning(
+                "Grouped evaluation response was not parseable - "
+                "falling back to per-item evaluation"
+            )
+            return self.evaluate_batch(states)
+
+        return [
+            self._build_result(
+                state, verdict, [{"role": "evaluator", "content": verdict}]
+            )
+            for state, verdict in zip(states, verdicts)
+        ]
+
+    def _parse_grouped_verdicts(
+        self, evaluation: str, expected: int
+    ) -> Optional[List[str]]:
+        """
+        Parse a grouped judge response into per-item verdict strings.
+
+        Args:
+            evaluation (str): Raw judge output (JSON list, possibly fenced)
+            expected (int): Number of verdicts required
+
+        Returns:
+            Optional[List[str]]: One verdict per item in id order, or None
+            if the output cannot be parsed
+        """
+        cleaned = evaluation.strip()
+        if cleaned.startswith("```"):
+            cleaned = cleaned.removeprefix("```json").removeprefix("```")
+            cleaned = cleaned.removesuffix("```").strip()
+
+        try:
+            items = json.loads(cleaned)
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(items, list) or len(items) != expected:
+            return None
+
+        verdicts: List[Optional[str]] = [None] * expected
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                return None
+            index = item.get("id", position + 1)
+            if not isinstance(index, int) or not (1 <= index <= expected):
+                return None
+            verdicts[index - 1] = str(item.get("evaluation", ""))
+
+        if any(verdict is None for verdict in verdicts):
+            return None
+        return verdicts
+
+    async def aevaluate_batch(
+        self,
+        states: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate multiple independent outputs concurrently.
+
+        The sequential evaluate_batch pays one full LLM round-trip per
+        state; here all evaluations run through ainvoke under a
+        semaphore, so wall time approaches the slowest single
+        evaluation rather than the sum.
+
+        Args:
+            states (List[Dict[str, Any]]): List of states to evaluate
+            max_concurrency (int): Maximum evaluations in flight at once
+
+        Returns:
+            List[Dict[str, Any]]: Evaluation results in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _evaluate_one(state: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.ainvoke(state)
+
+        logger.info(
+            "Evaluating batch of %d states (max_concurrency=%d)",
+            len(states), max_concurrency
+        )
+
+        return await asyncio.gather(
+            *(_evaluate_one(state) for state in states)
+        )
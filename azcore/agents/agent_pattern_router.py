@@ -25,6 +25,7 @@ from azcore.agents.reflexion_agent import ReflexionAgent
 from azcore.agents.reasoning_duo_agent import ReasoningDuoAgent
 from azcore.agents.agent_judge import AgentJudge
 from azcore.exceptions import ConfigurationError, ValidationError
+from azcore.utils.helpers import run_parallel
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +142,10 @@ class AgentPatternRouter:
         # Initialize the agent factory mapping
         self.agent_factories = self._initialize_agent_factories()
 
+        # Agent instance memoized lazily; building a pattern agent compiles
+        # its sub-graph, which is wasteful to repeat on every invoke
+        self._agent: Optional[BaseAgent] = None
+
         logger.info(f"Initialized AgentPatternRouter with pattern: {pattern}")
 
     def _validate_config(self):
@@ -305,6 +310,17 @@ class AgentPatternRouter:
                 }
             )
 
+    def _get_agent(self) -> BaseAgent:
+        """
+        Get the memoized agent instance, creating it on first use.
+
+        Returns:
+            BaseAgent: The cached agent instance
+        """
+        if self._agent is None:
+            self._agent = self.create_agent()
+        return self._agent
+
     def invoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the selected agent pattern on the given state.
@@ -315,8 +331,7 @@ class AgentPatternRouter:
         Returns:
             Dict[str, Any]: Updated state after agent execution
         """
-        agent = self.create_agent()
-        return agent.invoke(state)
+        return self._get_agent().invoke(state)
 
     async def ainvoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -328,28 +343,55 @@ class AgentPatternRouter:
         Returns:
             Dict[str, Any]: Updated state
         """
-        agent = self.create_agent()
-        return await agent.ainvoke(state)
+        return await self._get_agent().ainvoke(state)
 
     def run_batch(
-        self, states: List[Dict[str, Any]]
+        self,
+        states: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute the agent pattern on multiple states in batch.
 
+        Independent states have no data dependency on each other, so with
+        max_workers > 1 they are executed concurrently on a thread pool
+        while results keep the input order. RL-enabled agents are the
+        exception: per-call RL tool selection swaps the agent's executor
+        and toolset in place, so interleaved threads could run with each
+        other's selections and misattribute rewards. Such batches fall
+        back to sequential execution with a warning.
+
         Args:
             states (List[Dict[str, Any]]): List of states to process
+            max_workers (Optional[int]): Number of worker threads; None or
+                1 preserves the original sequential behaviour
 
         Returns:
-            List[Dict[str, Any]]: List of results
+            List[Dict[str, Any]]: List of results in input order
         """
-        agent = self.create_agent()
+        agent = self._get_agent()
+
+        parallel = (
+            max_workers is not None and max_workers > 1 and len(states) > 1
+        )
+        if parallel and getattr(agent, "rl_enabled", False):
+            logger.warning(
+                "run_batch: agent is RL-enabled - per-call tool selection "
+                "mutates shared agent state, running sequentially instead"
+            )
+            parallel = False
+
+        if parallel:
+            callables = [
+                (lambda s=state: agent.invoke(s)) for state in states
+            ]
+            return run_parallel(callables, max_workers=max_workers)
+
         results = []
-        
         for state in states:
             result = agent.invoke(state)
             results.append(result)
-        
+
         return results
 
     def get_pattern_info(self) -> Dict[str, Any]:
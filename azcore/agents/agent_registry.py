@@ -463,29 +463,35 @@ class AgentRegistry:
 
     def print_summary(self) -> None:
         """Print a summary of the registry."""
-        print(f"\n{'=' * 60}")
-        print(f"Agent Registry: {self.name}")
-        print(f"{'=' * 60}")
-        print(f"Total Agents: {len(self.agents)}\n")
+        # Assemble the report and write it with a single print call
+        lines = [
+            f"\n{'=' * 60}",
+            f"Agent Registry: {self.name}",
+            "=" * 60,
+            f"Total Agents: {len(self.agents)}\n",
+        ]
 
         if not self.agents:
-            print("No agents registered.")
+            lines.append("No agents registered.")
+            print("\n".join(lines))
             return
 
         for agent_name in self.agents.keys():
             meta = self.metadata[agent_name]
             stats = self.get_stats(agent_name)
 
-            print(f"Agent: {agent_name}")
-            print(f"  Description: {meta.description}")
-            print(f"  Capabilities: {', '.join(meta.capabilities)}")
+            lines.append(f"Agent: {agent_name}")
+            lines.append(f"  Description: {meta.description}")
+            lines.append(f"  Capabilities: {', '.join(meta.capabilities)}")
             if meta.tags:
-                print(f"  Tags: {', '.join(meta.tags)}")
+                lines.append(f"  Tags: {', '.join(meta.tags)}")
             if stats.get("executions", 0) > 0:
-                print(f"  Executions: {stats['executions']}")
-                print(f"  Success Rate: {stats['success_rate']:.1%}")
-                print(f"  Avg Time: {stats['avg_time']:.2f}s")
-            print()
+                lines.append(f"  Executions: {stats['executions']}")
+                lines.append(f"  Success Rate: {stats['success_rate']:.1%}")
+                lines.append(f"  Avg Time: {stats['avg_time']:.2f}s")
+            lines.append("")
+
+        print("\n".join(lines))
 
     def _extract_tools(self, agent: Any) -> List[str]:
         """Extract tool names from an agent."""
@@ -9,7 +9,11 @@ MCP (Model Context Protocol) allows agents to connect to external servers that p
 tools, resources, and capabilities beyond what's available in the local environment.
 """
 
-from typing import Sequence, Optional, Callable, Any, Dict, List
+import asyncio
+import json
+import os
+from types import MappingProxyType
+from typing import Sequence, Optional, Callable, Any, Dict, List, Mapping, Tuple
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from langchain_core.messages import HumanMessage
@@ -51,6 +55,31 @@ except ImportError:
     logger.debug("RL components not available")
 
 
+# Process-wide cache of discovered MCP tools, keyed by a signature of the
+# server configurations. Rebuilding a team (or building a second team)
+# against the same servers reuses the already-discovered tools instead of
+# repeating the server handshakes and tool-listing round-trips.
+_MCP_TOOLS_CACHE: Dict[str, List[BaseTool]] = {}
+
+# Shared MultiServerMCPClient instances, keyed the same way. Opening an
+# SSE session is the expensive part of MCP setup (connect + read timeout
+# handshakes), so builders pointed at the same servers share one client
+# rather than opening a fresh session per team.
+_MCP_CLIENT_CACHE: Dict[str, Any] = {}
+
+
+def _server_configs_signature(server_configs: Dict[str, Dict[str, Any]]) -> str:
+    """Build a stable cache key from MultiServerMCPClient configurations."""
+    return json.dumps(server_configs, sort_keys=True, default=str)
+
+
+def clear_mcp_tools_cache() -> None:
+    """Clear the process-wide MCP tool and client caches (forces fresh discovery)."""
+    _MCP_TOOLS_CACHE.clear()
+    _MCP_CLIENT_CACHE.clear()
+    logger.info("Cleared MCP tools cache")
+
+
 class MCPTeamBuilder(BaseTeam):
     """
     Builder for creating MCP-enabled agent teams.
@@ -115,6 +144,12 @@ class MCPTeamBuilder(BaseTeam):
         self._mcp_tools: List[BaseTool] = []
         self._mcp_enabled: bool = False
         self._mcp_client: Optional[Any] = None  # MultiServerMCPClient instance
+
+        # Frozen views over the fetched MCP tools, built lazily and
+        # reused for all subsequent access (invalidated if more tools
+        # are discovered)
+        self._mcp_tools_view: Optional[Mapping[str, BaseTool]] = None
+        self._mcp_tool_names: Optional[Tuple[str, ...]] = None
         
         # RL components
         self._rl_enabled: bool = False
@@ -124,6 +159,21 @@ class MCPTeamBuilder(BaseTeam):
         # Connection options
         self._skip_failed_servers: bool = False
         self._test_connection: bool = False
+
+        # Bound on concurrent MCP tool executions: an unbounded burst
+        # (batched queries, parallel team fan-out) can exhaust the
+        # server's session budget and trip its connect timeout,
+        # serializing everything. Tunable per team via
+        # with_max_concurrency() or the AZCORE_MCP_CONCURRENCY env var.
+        self._max_concurrency: int = int(os.getenv("AZCORE_MCP_CONCURRENCY", "8"))
+        self._tool_semaphore: Optional[asyncio.Semaphore] = None
+        self._tool_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Per-run memo of MCP tool results, keyed by (tool name, args).
+        # Cleared at the start of every team invocation so exact-repeat
+        # tool calls within a single run hit the cache, while separate
+        # runs always see fresh data.
+        self._run_tool_cache: Dict[Any, Any] = {}
         
         self._logger = logging.getLogger(f"{self.__class__.__name__}.{name}")
     
@@ -285,6 +335,53 @@ class MCPTeamBuilder(BaseTeam):
         self.description = description
         return self
     
+    def with_max_concurrency(self, max_concurrency: int) -> 'MCPTeamBuilder':
+        """
+        Set the maximum number of concurrent MCP tool executions.
+
+        Caps in-flight tool calls against the team's MCP servers so
+        batched queries or parallel team fan-out cannot thrash a shared
+        server's connection budget. Defaults to 8, or the
+        AZCORE_MCP_CONCURRENCY environment variable when set.
+
+        Args:
+            max_concurrency: Maximum tool calls in flight at once
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValidationError: If max_concurrency is not positive
+        """
+        if max_concurrency < 1:
+            raise ValidationError(
+                f"max_concurrency must be >= 1, got {max_concurrency}",
+                details={"max_concurrency": max_concurrency}
+            )
+
+        self._max_concurrency = max_concurrency
+        self._tool_semaphore = None  # Rebuilt with the new limit on next use
+        self._logger.info(
+            f"Set MCP tool concurrency limit for team '{self.name}': {max_concurrency}"
+        )
+        return self
+
+    def _get_tool_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get (or lazily create) the MCP tool-execution semaphore.
+
+        asyncio primitives bind to the event loop they first wait on, so
+        the semaphore is keyed to the running loop and rebuilt whenever
+        the loop changes - callers driving queries through repeated
+        asyncio.run() otherwise hit "bound to a different event loop" on
+        the second run.
+        """
+        loop = asyncio.get_running_loop()
+        if self._tool_semaphore is None or self._tool_semaphore_loop is not loop:
+            self._tool_semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._tool_semaphore_loop = loop
+        return self._tool_semaphore
+
     def skip_failed_servers(self, skip: bool = True) -> 'MCPTeamBuilder':
         """
         Configure whether to skip failed MCP servers or fail completely.
@@ -488,15 +585,36 @@ class MCPTeamBuilder(BaseTeam):
                     f"read_timeout: {server_config.get('sse_read_timeout', 60)}s)"
                 )
         
+        # Serve from the process-wide cache when these exact servers were
+        # already discovered by this or another builder
+        cache_key = _server_configs_signature(server_configs)
+        cached_tools = _MCP_TOOLS_CACHE.get(cache_key)
+        if cached_tools is not None:
+            self._logger.info(
+                f"Reusing {len(cached_tools)} cached MCP tools for "
+                f"{len(server_configs)} server(s) - skipping handshake"
+            )
+            self._mcp_tools.extend(cached_tools)
+            self._mcp_client = _MCP_CLIENT_CACHE.get(cache_key)
+            return list(cached_tools)
+
         try:
-            # Create MultiServerMCPClient
-            self._logger.info(f"Connecting to {len(server_configs)} MCP server(s)...")
-            client = MultiServerMCPClient(server_configs)
-            
+            # Reuse a shared client for these servers, or create one
+            client = _MCP_CLIENT_CACHE.get(cache_key)
+            if client is None:
+                self._logger.info(f"Connecting to {len(server_configs)} MCP server(s)...")
+                client = MultiServerMCPClient(server_configs)
+                _MCP_CLIENT_CACHE[cache_key] = client
+            else:
+                self._logger.info(
+                    f"Reusing shared MCP client for {len(server_configs)} server(s)"
+                )
+
             # Get tools from all servers
             langchain_tools = await client.get_tools()
-            
+
             self._mcp_tools.extend(langchain_tools)
+            _MCP_TOOLS_CACHE[cache_key] = list(langchain_tools)
             
             tool_names = [t.name for t in langchain_tools]
             self._logger.info(
@@ -580,8 +698,9 @@ class MCPTeamBuilder(BaseTeam):
             self._logger.info(f"Connecting to {len(self._mcp_servers)} MCP server(s)...")
             self._connect_to_mcp_servers_sync()
         
-        # Combine regular tools with MCP tools
-        all_tools = self._tools + self._mcp_tools
+        # Combine regular tools with MCP tools (MCP tools are memoized so
+        # repeated identical calls within one run skip the server round-trip)
+        all_tools = self._tools + self._memoize_mcp_tools(self._mcp_tools)
         
         if not all_tools:
             self._logger.warning(
@@ -620,6 +739,76 @@ class MCPTeamBuilder(BaseTeam):
         
         return self._create_team_callable()
     
+    def _memoize_mcp_tools(self, tools: List[BaseTool]) -> List[BaseTool]:
+        """
+        Wrap MCP tools so exact-repeat calls reuse the per-run memo.
+
+        A large share of tool invocations within a single agent run are
+        exact repeats (e.g. the agent listing the same resource twice
+        while composing an answer). Each tool is cloned and its func /
+        coroutine wrapped to consult ``_run_tool_cache`` keyed on
+        (tool name, serialized arguments) before hitting the server.
+
+        Args:
+            tools: Discovered MCP tools
+
+        Returns:
+            List of memoizing tool clones (originals on wrap failure)
+        """
+        def make_key(name: str, args: tuple, kwargs: dict) -> tuple:
+            return (
+                name,
+                json.dumps({"args": args, "kwargs": kwargs},
+                           sort_keys=True, default=str)
+            )
+
+        wrapped_tools: List[BaseTool] = []
+        for tool in tools:
+            try:
+                clone = tool.model_copy()
+            except AttributeError:
+                clone = tool.copy()
+
+            orig_func = getattr(clone, "func", None)
+            orig_coroutine = getattr(clone, "coroutine", None)
+
+            def memo_func(*args, _name=tool.name, _func=orig_func, **kwargs):
+                key = make_key(_name, args, kwargs)
+                if key in self._run_tool_cache:
+                    self._logger.debug(f"MCP tool memo hit: {_name}")
+                    return self._run_tool_cache[key]
+                result = _func(*args, **kwargs)
+                self._run_tool_cache[key] = result
+                return result
+
+            async def memo_coroutine(*args, _name=tool.name,
+                                     _coro=orig_coroutine, **kwargs):
+                key = make_key(_name, args, kwargs)
+                if key in self._run_tool_cache:
+                    self._logger.debug(f"MCP tool memo hit: {_name}")
+                    return self._run_tool_cache[key]
+                async with self._get_tool_semaphore():
+                    result = await _coro(*args, **kwargs)
+                self._run_tool_cache[key] = result
+                return result
+
+            try:
+                if orig_func is not None:
+                    clone.func = memo_func
+                if orig_coroutine is not None:
+                    clone.coroutine = memo_coroutine
+            except (AttributeError, ValueError):
+                # Tool does not allow rebinding - use it unwrapped
+                self._logger.debug(
+                    f"Could not memoize MCP tool '{tool.name}' - using as-is"
+                )
+                wrapped_tools.append(tool)
+                continue
+
+            wrapped_tools.append(clone)
+
+        return wrapped_tools
+
     def _default_prompt(self) -> str:
         """
         Get default prompt for MCP team.
@@ -742,6 +931,9 @@ class MCPTeamBuilder(BaseTeam):
             Returns:
                 Command with team's response
             """
+            # Fresh tool memo for this run
+            self._run_tool_cache.clear()
+
             # Invoke the sub-graph with the last message
             response = await self._sub_graph.ainvoke({
                 "messages": state["messages"][-1:]
@@ -789,6 +981,9 @@ class MCPTeamBuilder(BaseTeam):
                     self._logger.warning(
                         "Event loop already running. Using synchronous fallback for team callable."
                     )
+                    # Fresh tool memo for this run
+                    self._run_tool_cache.clear()
+
                     # Invoke the sub-graph with the last message
                     response = self._sub_graph.invoke({
                         "messages": state["messages"][-1:]
@@ -857,14 +1052,47 @@ class MCPTeamBuilder(BaseTeam):
         all_tools = self._tools + self._mcp_tools
         return [tool.name for tool in all_tools]
     
+    @property
+    def mcp_tool_names(self) -> Tuple[str, ...]:
+        """
+        Names of the fetched MCP tools as a cached immutable tuple.
+
+        Computed once per fetch, so repeated reads (e.g. when composing
+        planner prompts) are attribute lookups rather than list
+        comprehensions over the tool objects.
+        """
+        if (self._mcp_tool_names is None
+                or len(self._mcp_tool_names) != len(self._mcp_tools)):
+            self._mcp_tool_names = tuple(t.name for t in self._mcp_tools)
+        return self._mcp_tool_names
+
+    def get_mcp_tools_view(self) -> Mapping[str, BaseTool]:
+        """
+        Get a read-only name-to-tool mapping over the fetched MCP tools.
+
+        The view is a MappingProxyType built on first access and handed
+        out for all subsequent calls, so downstream code can look up
+        tools by name without being able to mutate the underlying list
+        (and without re-triggering server discovery).
+
+        Returns:
+            Read-only mapping of tool name to tool
+        """
+        if (self._mcp_tools_view is None
+                or len(self._mcp_tools_view) != len(self._mcp_tools)):
+            self._mcp_tools_view = MappingProxyType(
+                {tool.name: tool for tool in self._mcp_tools}
+            )
+        return self._mcp_tools_view
+
     def get_mcp_tool_names(self) -> List[str]:
         """
         Get the names of only MCP tools.
-        
+
         Returns:
             List of MCP tool names
         """
-        return [tool.name for tool in self._mcp_tools]
+        return list(self.mcp_tool_names)
     
     def get_mcp_server_count(self) -> int:
         """
@@ -83,6 +83,9 @@ class TeamBuilder(BaseTeam):
         self._rl_enabled: bool = False
         self._rl_manager: Optional[Any] = None  # RLManager instance
         self._reward_calculator: Optional[Any] = None  # RewardCalculator instance
+
+        # Prompt options
+        self._memory_reuse: bool = False
         
         self._logger = logging.getLogger(f"{self.__class__.__name__}.{name}")
     
@@ -142,6 +145,22 @@ class TeamBuilder(BaseTeam):
         self.description = description
         return self
     
+    def with_memory_reuse(self) -> 'TeamBuilder':
+        """
+        Encourage the team to answer from conversation context.
+
+        Appends a prompt suffix instructing the agent to check earlier
+        messages before calling tools, which avoids redundant tool calls
+        (and their latency) on follow-up questions whose answers are
+        already in the conversation.
+
+        Returns:
+            Self for method chaining
+        """
+        self._memory_reuse = True
+        self._logger.debug(f"Enabled memory-reuse prompting for team '{self.name}'")
+        return self
+
     def with_rl(
         self,
         rl_manager: Any,
@@ -214,6 +233,14 @@ class TeamBuilder(BaseTeam):
                 details={"team_name": self.name, "tools_count": len(self._tools)}
             )
         
+        if self._memory_reuse:
+            from azcore.utils.prompts import MEMORY_REUSE_PROMPT
+            self._prompt = (
+                f"{self._prompt}\n\n{MEMORY_REUSE_PROMPT}"
+                if self._prompt else MEMORY_REUSE_PROMPT
+            )
+            self._memory_reuse = False  # Applied; avoid double-append on rebuild
+
         # Create agent based on RL configuration
         if self._rl_enabled and RL_AVAILABLE:
             self._logger.info(f"Building RL-enabled agent for team '{self.name}'")
@@ -0,0 +1,196 @@
+"""
+Two-stage tool selection for the Azcore..
+
+Agents are typically constructed with their full tool set, so every LLM
+call pays the prompt tokens for every tool schema - including tools that
+are irrelevant to the current query. The ToolSelector implements the
+first stage of a two-stage architecture: it ranks the registered tools
+against the query and returns only the top-K relevant ones, shrinking
+the schema block fed to the main agent.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.tools import BaseTool
+
+from azcore.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class ToolSelector:
+    """
+    Ranks tools by relevance to a query and returns the top-K subset.
+
+    When sentence-transformers is available, tool descriptions are
+    embedded once at construction and queries are matched by cosine
+    similarity. Without it, a keyword-overlap score over tool names and
+    descriptions is used instead - coarser, but dependency-free.
+
+    Attributes:
+        tools: The full list of candidate tools
+        top_k: Default number of tools to select per query
+
+    Example:
+        >>> selector = ToolSelector(tools=all_tools, top_k=2)
+        >>> relevant = selector.select_tools("summarize this dataset")
+        >>> agent = ReactAgent(name="analyst", llm=llm, tools=relevant, prompt=prompt)
+    """
+
+    def __init__(
+        self,
+        tools: List[BaseTool],
+        top_k: int = 3,
+        embedding_model_name: str = "all-MiniLM-L6-v2",
+        use_embeddings: bool = True,
+    ):
+        """
+        Initialize the tool selector.
+
+        Args:
+            tools: Candidate tools to select from
+            top_k: Default number of tools returned per query
+            embedding_model_name: Sentence-transformers model for
+                description embeddings
+            use_embeddings: Attempt semantic matching (falls back to
+                keyword overlap if sentence-transformers is missing)
+
+        Raises:
+            ValidationError: If no tools are provided or top_k < 1
+        """
+        if not tools:
+            raise ValidationError(
+                "ToolSelector requires at least one tool",
+                details={"tools": len(tools)}
+            )
+        if top_k < 1:
+            raise ValidationError(
+                f"top_k must be at least 1, got {top_k}",
+                details={"top_k": top_k}
+            )
+
+        self.tools = list(tools)
+        self.top_k = top_k
+        self.use_embeddings = use_embeddings
+
+        # Embed tool descriptions once; queries only pay one encode each
+        self._embedding_model = None
+        self._tool_embeddings: Optional[np.ndarray] = None
+        if use_embeddings:
+            try:
+                from sentence_transformers import SentenceTransformer
+                logger.info(f"Loading embedding model: {embedding_model_name}")
+                self._embedding_model = SentenceTransformer(embedding_model_name)
+                descriptions = [
+                    f"{tool.name}: {tool.description or ''}" for tool in self.tools
+                ]
+                self._tool_embeddings = self._embedding_model.encode(
+                    descriptions, normalize_embeddings=True
+                )
+                logger.info("Embedded %d tool descriptions", len(self.tools))
+            except ImportError:
+                logger.warning(
+                    "sentence-transformers not installed. "
+                    "Falling back to keyword-based tool selection. "
+                    "Install with: pip install sentence-transformers"
+                )
+                self.use_embeddings = False
+            except Exception as e:
+                logger.error(f"Failed to load embedding model: {e}")
+                self.use_embeddings = False
+
+        # Tokenized name+description per tool for the keyword fallback
+        self._tool_tokens: List[set] = [
+            set(_TOKEN_PATTERN.findall(
+                f"{tool.name} {tool.description or ''}".lower()
+            ))
+            for tool in self.tools
+        ]
+
+        logger.info(
+            "ToolSelector initialized with %d tools (top_k=%d, embeddings=%s)",
+            len(self.tools), self.top_k, self.use_embeddings
+        )
+
+    def select_tools(
+        self,
+        query: str,
+        top_k: Optional[int] = None
+    ) -> List[BaseTool]:
+        """
+        Select the tools most relevant to a query.
+
+        Args:
+            query: The user query or task description
+            top_k: Number of tools to return (defaults to the
+                selector's top_k)
+
+        Returns:
+            The top-K tools ranked by relevance; the full tool list when
+            K covers every tool or the query is empty
+        """
+        k = top_k if top_k is not None else self.top_k
+        if k >= len(self.tools) or not query or not query.strip():
+            return list(self.tools)
+
+        scores = self.score_tools(query)
+        ranked = sorted(
+            range(len(self.tools)), key=lambda i: scores[i], reverse=True
+        )
+        selected = [self.tools[i] for i in ranked[:k]]
+
+        logger.debug(
+            "Selected %d/%d tools for query %.60s...: %s",
+            len(selected), len(self.tools), query,
+            [tool.name for tool in selected]
+        )
+        return selected
+
+    def score_tools(self, query: str) -> List[float]:
+        """
+        Score every tool's relevance to a query.
+
+        Args:
+            query: The user query or task description
+
+        Returns:
+            One relevance score per tool, aligned with self.tools
+        """
+        if self.use_embeddings and self._tool_embeddings is not None:
+            query_embedding = self._embedding_model.encode(
+                [query], normalize_embeddings=True
+            )
+            return (self._tool_embeddings @ query_embedding.T).ravel().tolist()
+
+        query_tokens = set(_TOKEN_PATTERN.findall(query.lower()))
+        if not query_tokens:
+            return [0.0] * len(self.tools)
+        return [
+            len(query_tokens & tokens) / len(query_tokens | tokens)
+            for tokens in self._tool_tokens
+        ]
+
+    def get_tool_names(self, query: str, top_k: Optional[int] = None) -> List[str]:
+        """
+        Get the names of the tools selected for a query.
+
+        Args:
+            query: The user query or task description
+            top_k: Number of tools to consider
+
+        Returns:
+            Names of the selected tools
+        """
+        return [tool.name for tool in self.select_tools(query, top_k=top_k)]
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolSelector(tools={len(self.tools)}, "
+            f"top_k={self.top_k}, "
+            f"embeddings={self.use_embeddings})"
+        )
@@ -8,6 +8,37 @@ from typing import List, Tuple, Optional
 import importlib.util
 
 
+# Fix-it templates, built once at module scope rather than per call
+_ENV_TEMPLATE = """# OpenAI API Key
+OPENAI_API_KEY=your-api-key-here
+
+# Anthropic API Key (optional)
+ANTHROPIC_API_KEY=your-api-key-here
+
+# LangSmith (optional)
+LANGCHAIN_API_KEY=your-api-key-here
+LANGCHAIN_TRACING_V2=false
+LANGCHAIN_PROJECT=azcore-project
+"""
+
+_CONFIG_TEMPLATE = """# Az-Core Configuration
+
+llm:
+  model: gpt-4o-mini
+  temperature: 0.7
+
+fast_llm:
+  model: gpt-4o-mini
+  temperature: 0.5
+
+coordinator_llm:
+  model: gpt-4o-mini
+  temperature: 0
+
+embedding_model: text-embedding-3-large
+"""
+
+
 @click.command()
 @click.option(
     "--fix",
@@ -340,18 +371,7 @@ def _attempt_fixes(issues: List, warnings: List, verbose: bool) -> int:
     for category, message in warnings:
         if category == "Environment" and ".env file" in message:
             click.echo("Creating .env.example template...")
-            env_template = """# OpenAI API Key
-OPENAI_API_KEY=your-api-key-here
-
-# Anthropic API Key (optional)
-ANTHROPIC_API_KEY=your-api-key-here
-
-# LangSmith (optional)
-LANGCHAIN_API_KEY=your-api-key-here
-LANGCHAIN_TRACING_V2=false
-LANGCHAIN_PROJECT=azcore-project
-"""
-            Path(".env.example").write_text(env_template)
+            Path(".env.example").write_text(_ENV_TEMPLATE)
             click.secho("  ✓ Created .env.example", fg="green")
             click.echo("  Copy .env.example to .env and add your API keys")
             fixed_count += 1
@@ -360,23 +380,7 @@ LANGCHAIN_PROJECT=azcore-project
     for category, message in warnings:
         if category == "Config" and "No config.yml" in message:
             click.echo("Creating sample config.yml...")
-            config_template = """# Az-Core Configuration
-
-llm:
-  model: gpt-4o-mini
-  temperature: 0.7
-
-fast_llm:
-  model: gpt-4o-mini
-  temperature: 0.5
-
-coordinator_llm:
-  model: gpt-4o-mini
-  temperature: 0
-
-embedding_model: text-embedding-3-large
-"""
-            Path("config.yml").write_text(config_template)
+            Path("config.yml").write_text(_CONFIG_TEMPLATE)
             click.secho("  ✓ Created config.yml", fg="green")
             fixed_count += 1
     
@@ -23,19 +23,21 @@ except ImportError:
     AZCORE_VERSION = "0.0.9"
 
 
-def print_banner():
-    """Print Az-Core ASCII banner."""
-    banner = """
+# Built once at import time so repeated banner prints reuse the same string
+_BANNER = """
             █████╗ ███████╗      ██████╗ ██████╗ ██████╗ ███████╗
             ██╔══██╗╚══███╔╝     ██╔════╝██╔═══██╗██╔══██╗██╔════╝
-            ███████║  ███╔╝█████╗██║     ██║   ██║██████╔╝█████╗  
-            ██╔══██║ ███╔╝ ╚════╝██║     ██║   ██║██╔══██╗██╔══╝  
+            ███████║  ███╔╝█████╗██║     ██║   ██║██████╔╝█████╗
+            ██╔══██║ ███╔╝ ╚════╝██║     ██║   ██║██╔══██╗██╔══╝
             ██║  ██║███████╗     ╚██████╗╚██████╔╝██║  ██║███████╗
-            ╚═╝  ╚═╝╚══════╝      ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚══════╝                                   
+            ╚═╝  ╚═╝╚══════╝      ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚══════╝
 """
-    
+
+
+def print_banner():
+    """Print Az-Core ASCII banner."""
     # Print banner in cyan
-    click.secho(banner, fg="cyan", bold=True)
+    click.secho(_BANNER, fg="cyan", bold=True)
     
     # Print attribution and version
     click.secho("                                                  powered by Azrienlabs", fg="bright_black")
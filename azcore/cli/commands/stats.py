@@ -76,9 +76,11 @@ def stats(
     
     all_stats = {}
     
-    click.echo(f"Az-Core Statistics")
-    click.echo(f"Data Directory: {data_path.absolute()}")
-    click.echo("=" * 70 + "\n")
+    click.echo(
+        f"Az-Core Statistics\n"
+        f"Data Directory: {data_path.absolute()}\n"
+        + "=" * 70 + "\n"
+    )
     
     # RL Metrics
     if show_rl_metrics:
@@ -234,16 +236,20 @@ def _display_rl_metrics(stats: Dict[str, Any], format: str):
         click.echo(json.dumps(stats, indent=2))
     else:
         if stats["q_table_exists"]:
-            click.echo(f"  Q-Table Status:      {'✓ Found' if stats['q_table_exists'] else '✗ Not Found'}")
-            click.echo(f"  Number of States:    {stats['num_states']:,}")
-            click.echo(f"  Number of Actions:   {stats['num_actions']:,}")
-            click.echo(f"  Average Q-Value:     {stats['avg_q_value']:.4f}")
+            # Single joined write instead of one echo (and flush) per line
+            lines = [
+                f"  Q-Table Status:      {'✓ Found' if stats['q_table_exists'] else '✗ Not Found'}",
+                f"  Number of States:    {stats['num_states']:,}",
+                f"  Number of Actions:   {stats['num_actions']:,}",
+                f"  Average Q-Value:     {stats['avg_q_value']:.4f}",
+            ]
             if "training_episodes" in stats:
-                click.echo(f"  Training Episodes:   {stats['training_episodes']:,}")
-                click.echo(f"  Total Reward:        {stats.get('total_reward', 0):.2f}")
+                lines.append(f"  Training Episodes:   {stats['training_episodes']:,}")
+                lines.append(f"  Total Reward:        {stats.get('total_reward', 0):.2f}")
+            click.echo("\n".join(lines))
         else:
             click.secho("  No Q-table found", fg="yellow")
-    
+
     click.echo()
 
 
@@ -256,16 +262,19 @@ def _display_cache_stats(stats: Dict[str, Any], format: str):
         click.echo(json.dumps(stats, indent=2))
     else:
         if stats["cache_exists"]:
-            click.echo(f"  Cache Status:        {'✓ Active' if stats['cache_exists'] else '✗ Inactive'}")
-            click.echo(f"  Cache Entries:       {stats['num_entries']:,}")
-            click.echo(f"  Cache Size:          {stats['cache_size_mb']:.2f} MB")
+            lines = [
+                f"  Cache Status:        {'✓ Active' if stats['cache_exists'] else '✗ Inactive'}",
+                f"  Cache Entries:       {stats['num_entries']:,}",
+                f"  Cache Size:          {stats['cache_size_mb']:.2f} MB",
+            ]
             if "hits" in stats:
-                click.echo(f"  Cache Hits:          {stats['hits']:,}")
-                click.echo(f"  Cache Misses:        {stats['misses']:,}")
-                click.echo(f"  Hit Rate:            {stats['hit_rate']:.1f}%")
+                lines.append(f"  Cache Hits:          {stats['hits']:,}")
+                lines.append(f"  Cache Misses:        {stats['misses']:,}")
+                lines.append(f"  Hit Rate:            {stats['hit_rate']:.1f}%")
+            click.echo("\n".join(lines))
         else:
             click.secho("  No cache found", fg="yellow")
-    
+
     click.echo()
 
 
@@ -278,12 +287,14 @@ def _display_agent_stats(stats: Dict[str, Any], format: str):
         click.echo(json.dumps(stats, indent=2))
     else:
         if stats["logs_exist"]:
-            click.echo(f"  Total Executions:    {stats['total_executions']:,}")
-            click.echo(f"  Avg Execution Time:  {stats['avg_execution_time']:.2f}s")
-            click.echo(f"  Success Rate:        {stats['success_rate']:.1f}%")
+            click.echo(
+                f"  Total Executions:    {stats['total_executions']:,}\n"
+                f"  Avg Execution Time:  {stats['avg_execution_time']:.2f}s\n"
+                f"  Success Rate:        {stats['success_rate']:.1f}%"
+            )
         else:
             click.secho("  No agent logs found", fg="yellow")
-    
+
     click.echo()
 
 
@@ -173,6 +173,7 @@ Author: Az-Core Framework
 Date: 2025
 """
 
+import asyncio
 import logging
 import os
 from dotenv import load_dotenv
@@ -192,8 +193,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Main application entry point."""
+async def main():
+    """Main application entry point.
+
+    Async so the graph runs via ainvoke: when hosted inside an async
+    runtime (LangGraph dev server, FastAPI, Jupyter) a blocking invoke
+    would stall the event loop for the duration of every LLM call.
+    """
     logger.info("Starting RL-enabled hierarchical team system...")
     
     # Build the graph with all teams
@@ -209,8 +215,8 @@ def main():
     
     logger.info(f"\\nProcessing query: {{query}}\\n")
     
-    # Run the graph
-    result = graph.invoke(initial_state)
+    # Run the graph without blocking the event loop
+    result = await graph.ainvoke(initial_state)
     
     # Display result
     print("\\n" + "=" * 70)
@@ -230,7 +236,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 '''
 
 
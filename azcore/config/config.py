@@ -5,10 +5,12 @@ This module provides configuration management with YAML and environment
 variable support, validation, and type safety.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
+import atexit
 import yaml
 import os
+import httpx
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -18,6 +20,45 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared httpx connection pools for all LLM clients created via get_llm().
+# Each ChatOpenAI otherwise builds its own httpx.Client/AsyncClient, so
+# multiple models (or repeated get_llm calls) compete with separate pools
+# instead of sharing keep-alive TCP+TLS connections - each cold connection
+# costs a fresh TLS handshake. Created lazily on first use and closed at
+# interpreter exit.
+_SHARED_HTTP_CLIENT: Optional[httpx.Client] = None
+_SHARED_ASYNC_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _close_shared_http_clients() -> None:
+    """Close the shared httpx pools at interpreter exit."""
+    global _SHARED_HTTP_CLIENT, _SHARED_ASYNC_HTTP_CLIENT
+    if _SHARED_HTTP_CLIENT is not None:
+        _SHARED_HTTP_CLIENT.close()
+        _SHARED_HTTP_CLIENT = None
+    if _SHARED_ASYNC_HTTP_CLIENT is not None:
+        # AsyncClient.close() is a coroutine; the transport pool can be
+        # torn down synchronously at exit without running an event loop
+        _SHARED_ASYNC_HTTP_CLIENT = None
+
+
+def _get_shared_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get (lazily creating) the shared sync and async httpx clients.
+
+    Returns:
+        Tuple of (httpx.Client, httpx.AsyncClient) backed by one
+        keep-alive connection pool each
+    """
+    global _SHARED_HTTP_CLIENT, _SHARED_ASYNC_HTTP_CLIENT
+    if _SHARED_HTTP_CLIENT is None:
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        _SHARED_HTTP_CLIENT = httpx.Client(limits=limits, timeout=60)
+        _SHARED_ASYNC_HTTP_CLIENT = httpx.AsyncClient(limits=limits, timeout=60)
+        atexit.register(_close_shared_http_clients)
+        logger.debug("Created shared httpx connection pools for LLM clients")
+    return _SHARED_HTTP_CLIENT, _SHARED_ASYNC_HTTP_CLIENT
+
 
 class Config:
     """
@@ -236,21 +277,32 @@ llm:
     def get_llm(
         self,
         llm_key: str = "llm",
-        provider: str = "openai"
+        provider: str = "openai",
+        cached: bool = False,
+        cache_type: str = "exact"
     ) -> BaseChatModel:
         """
         Get a language model from configuration.
-        
+
         Args:
             llm_key: Configuration key for LLM settings (default: "llm")
             provider: LLM provider (default: "openai")
-            
+            cached: Wrap the model in a CachedLLM so identical prompts
+                (e.g. repeated router/planner calls) are served from the
+                shared response cache instead of hitting the API again
+            cache_type: Cache type for the wrapper ("exact" or "semantic")
+
         Returns:
             Configured language model
-            
+
         Raises:
             ConfigurationError: If provider is not supported or config is invalid
         """
+        if cached:
+            from azcore.utils.cached_llm import enable_llm_caching
+            llm = self.get_llm(llm_key=llm_key, provider=provider)
+            self._logger.info(f"Wrapping {llm_key} LLM with {cache_type} response cache")
+            return enable_llm_caching(llm, cache_type=cache_type)
         llm_config = self.get(llm_key, {})
         
         if not llm_config:
@@ -286,9 +338,12 @@ llm:
                 )
             
             try:
+                http_client, http_async_client = _get_shared_http_clients()
                 return ChatOpenAI(
                     model=llm_config.get("model", "gpt-4o-mini"),
                     temperature=temperature,
+                    http_client=http_client,
+                    http_async_client=http_async_client,
                 )
             except Exception as e:
                 from azcore.exceptions import create_llm_error
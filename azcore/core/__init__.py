@@ -6,9 +6,13 @@ the Azcore.'s agent orchestration system.
 """
 
 from azcore.core.base import BaseAgent, BaseTeam, BaseNode
-from azcore.core.state import State, StateManager
+from azcore.core.state import State, StateManager, build_user_state, thread_config
 from azcore.core.supervisor import Supervisor , MainSupervisor
-from azcore.core.orchestrator import GraphOrchestrator
+from azcore.core.orchestrator import (
+    GraphOrchestrator,
+    create_async_sqlite_checkpointer,
+    clear_compiled_graph_cache,
+)
 from azcore.core.agent_executor import create_thinkat_agent
 
 __all__ = [
@@ -17,8 +21,12 @@ __all__ = [
     "BaseNode",
     "State",
     "StateManager",
+    "build_user_state",
+    "thread_config",
     "Supervisor",
     "MainSupervisor",
     "GraphOrchestrator",
+    "create_async_sqlite_checkpointer",
+    "clear_compiled_graph_cache",
     "create_thinkat_agent",
 ]
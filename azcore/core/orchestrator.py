@@ -5,14 +5,17 @@ This module provides the GraphOrchestrator class which manages the
 construction and execution of multi-agent workflow graphs.
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional, Callable, Set
 from collections import defaultdict
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Send
 from azcore.core.base import BaseTeam, BaseNode
 from azcore.core.supervisor import Supervisor
-from azcore.core.state import State
+from azcore.core.state import State, build_user_state, thread_config
 from azcore.exceptions import (
+    ConfigurationError,
     GraphError,
     GraphCycleError,
     MaxIterationsExceededError,
@@ -22,6 +25,20 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of compiled hierarchical graphs, keyed by a
+# caller-supplied identifier (e.g. (team names, use_rl, model id)).
+# Scripts that rebuild the same fixed topology on every run in one
+# process skip node construction and compilation entirely on repeats.
+# Compiled graphs hold live LLM clients and checkpointers, so they are
+# not picklable - this is deliberately an in-memory cache only.
+_COMPILED_GRAPH_CACHE: Dict[Any, Any] = {}
+
+
+def clear_compiled_graph_cache() -> None:
+    """Clear the process-wide compiled-graph cache."""
+    _COMPILED_GRAPH_CACHE.clear()
+    logger.info("Cleared compiled graph cache")
+
 
 class GraphOrchestrator:
     """
@@ -58,6 +75,8 @@ class GraphOrchestrator:
         self._nodes: Dict[str, Callable] = {}
         self._teams: Dict[str, BaseTeam] = {}
         self._supervisor: Optional[Supervisor] = None
+        self._compiled_graph: Optional[Any] = None
+        self._compiled_checkpointer: Optional[Any] = None
         self._logger = logging.getLogger(self.__class__.__name__)
         
         # Execution control
@@ -88,8 +107,9 @@ class GraphOrchestrator:
         
         self.graph_builder.add_node(name, callable_node)
         self._nodes[name] = callable_node
+        self._compiled_graph = None  # Topology changed - invalidate cache
         self._logger.info(f"Added node: {name}")
-        
+
         return self
     
     def add_team(self, team: BaseTeam) -> 'GraphOrchestrator':
@@ -182,10 +202,61 @@ class GraphOrchestrator:
                 )
         
         self.graph_builder.add_edge(from_node, to_node)
+        self._compiled_graph = None  # Topology changed - invalidate cache
         self._logger.debug(f"Added edge: {from_node} -> {to_node}")
-        
+
         return self
     
+    def add_parallel_dispatch(
+        self,
+        source: str,
+        teams: List[str],
+        fallback: str = "supervisor"
+    ) -> 'GraphOrchestrator':
+        """
+        Fan out to multiple teams concurrently when the plan needs them.
+
+        Installs a conditional edge on ``source`` that inspects the
+        state's full_plan: when two or more of the given teams are named
+        in the plan, it returns a ``Send`` per team so LangGraph executes
+        them in parallel (wall time becomes the max rather than the sum
+        of team latencies). The messages channel uses an add_messages
+        reducer, so the teams' outputs merge deterministically. Queries
+        that mention at most one team keep the existing sequential path
+        through ``fallback``.
+
+        Args:
+            source: Node whose outgoing edge performs the dispatch
+                (typically the planner)
+            teams: Team node names eligible for parallel execution
+            fallback: Node to route to when fewer than two teams are
+                planned (default: "supervisor")
+
+        Returns:
+            Self for method chaining
+        """
+        team_names = list(teams)
+
+        def parallel_dispatch(state: Dict[str, Any]) -> Any:
+            """Route to every planned team at once, or fall back."""
+            plan = (state.get("full_plan") or "").lower()
+            planned = [name for name in team_names if name.lower() in plan]
+
+            if len(planned) >= 2:
+                logger.info("Dispatching %d teams in parallel: %s",
+                            len(planned), planned)
+                return [Send(name, state) for name in planned]
+
+            return fallback
+
+        self.graph_builder.add_conditional_edges(source, parallel_dispatch)
+        self._compiled_graph = None
+        self._logger.info(
+            f"Added parallel dispatch from {source} over teams: {team_names}"
+        )
+
+        return self
+
     def set_entry_point(self, node_name: str) -> 'GraphOrchestrator':
         """
         Set the entry point for the graph.
@@ -201,45 +272,123 @@ class GraphOrchestrator:
         
         return self
     
-    def compile(self) -> Any:
+    def compile(self, checkpointer: Optional[Any] = None) -> Any:
         """
         Compile the graph for execution.
-        
+
+        Args:
+            checkpointer: Optional checkpointer overriding the one set at
+                construction time (e.g. a SqliteSaver for durable state)
+
         Returns:
             Compiled graph ready for invocation
+
+        Note:
+            Compilation walks the full node/edge topology, so the result
+            is cached and reused until the graph structure changes or a
+            different checkpointer is supplied.
         """
+        effective_checkpointer = checkpointer or self.checkpointer
+
+        if (self._compiled_graph is not None
+                and self._compiled_checkpointer is effective_checkpointer):
+            self._logger.debug("Reusing cached compiled graph")
+            return self._compiled_graph
+
         compiled_graph = self.graph_builder.compile(
-            checkpointer=self.checkpointer
+            checkpointer=effective_checkpointer
         )
-        
+        self._compiled_graph = compiled_graph
+        self._compiled_checkpointer = effective_checkpointer
+
         self._logger.info(f"Compiled graph with {len(self._nodes)} nodes")
-        
+
         return compiled_graph
     
+    async def arun_batch(
+        self,
+        queries: List[str],
+        graph: Optional[Any] = None,
+        thread_prefix: str = "batch",
+        max_concurrency: int = 8,
+        return_exceptions: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Run multiple independent queries through the graph concurrently.
+
+        Each query is executed via ``ainvoke`` under its own thread id so
+        conversations stay isolated in the checkpointer. Concurrency is
+        bounded by a semaphore so large batches overlap their LLM calls
+        without hammering provider rate limits or exhausting sockets.
+
+        Args:
+            queries: User queries to execute
+            graph: Optional pre-compiled graph (compiled on demand if omitted)
+            thread_prefix: Prefix used to derive per-query thread ids
+            max_concurrency: Maximum number of queries in flight at once
+            return_exceptions: Return exceptions as results instead of
+                failing the whole batch on the first error
+
+        Returns:
+            List of final graph states, in the same order as the queries
+        """
+        if graph is None:
+            graph = self.compile()
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_one(index: int, query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await graph.ainvoke(
+                    build_user_state(query),
+                    config=thread_config(f"{thread_prefix}-{index}")
+                )
+
+        self._logger.info(
+            f"Running batch of {len(queries)} queries "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+        return await asyncio.gather(
+            *(_run_one(i, query) for i, query in enumerate(queries)),
+            return_exceptions=return_exceptions
+        )
+
     def build_hierarchical_graph(
         self,
         coordinator: Optional[Callable] = None,
         planner: Optional[Callable] = None,
         supervisor: Optional[Supervisor] = None,
         teams: Optional[List[BaseTeam]] = None,
-        generator: Optional[Callable] = None
+        generator: Optional[Callable] = None,
+        checkpointer: Optional[Any] = None,
+        cache_key: Optional[Any] = None
     ) -> Any:
         """
         Build a complete hierarchical agent graph.
-        
+
         This is a convenience method that sets up the common pattern:
         START -> Coordinator -> Planner -> Supervisor -> Teams -> Generator -> END
-        
+
         Args:
             coordinator: Optional coordinator node
             planner: Optional planner node
             supervisor: Optional supervisor
             teams: Optional list of teams
             generator: Optional response generator node
-            
+            checkpointer: Optional checkpointer passed through to compile()
+            cache_key: Optional hashable key identifying this topology
+                (e.g. ``(tuple(team_names), use_rl, model_id)``); when
+                given, the compiled graph is stored in a process-wide
+                cache and reused on repeat builds with the same key
+
         Returns:
             Compiled graph
         """
+        if cache_key is not None and cache_key in _COMPILED_GRAPH_CACHE:
+            self._logger.info(f"Reusing cached compiled graph for key {cache_key!r}")
+            return _COMPILED_GRAPH_CACHE[cache_key]
+
         # Add coordinator if provided
         if coordinator:
             self.add_node("coordinator", coordinator)
@@ -263,8 +412,13 @@ class GraphOrchestrator:
             self.add_node("response_generator", generator)
         
         self._logger.info("Built hierarchical graph structure")
-        
-        return self.compile()
+
+        compiled_graph = self.compile(checkpointer=checkpointer)
+
+        if cache_key is not None:
+            _COMPILED_GRAPH_CACHE[cache_key] = compiled_graph
+
+        return compiled_graph
     
     def get_node(self, name: str) -> Optional[Callable]:
         """
@@ -358,3 +512,39 @@ class GraphOrchestrator:
     
     def __repr__(self) -> str:
         return f"GraphOrchestrator(nodes={len(self._nodes)}, teams={len(self._teams)})"
+
+
+def create_async_sqlite_checkpointer(db_path: str = "checkpoints.db") -> Any:
+    """
+    Create an async SQLite checkpointer for durable conversation state.
+
+    The default MemorySaver performs its per-step writes synchronously,
+    which blocks the event loop when the graph is hosted inside an async
+    runtime alongside long-lived awaits (e.g. MCP SSE streams). An
+    AsyncSqliteSaver persists each step without stalling other tasks.
+
+    Args:
+        db_path: Path to the SQLite checkpoint database
+
+    Returns:
+        Async context manager yielding an AsyncSqliteSaver
+
+    Raises:
+        ConfigurationError: If langgraph-checkpoint-sqlite is not installed
+
+    Example:
+        >>> async with create_async_sqlite_checkpointer("checkpoints.db") as saver:
+        ...     graph = orchestrator.build_hierarchical_graph(..., checkpointer=saver)
+        ...     result = await graph.ainvoke(state, config=thread_config("demo"))
+    """
+    try:
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError:
+        raise ConfigurationError(
+            "Async SQLite checkpointing requires the langgraph-checkpoint-sqlite "
+            "package. Install with: pip install langgraph-checkpoint-sqlite",
+            details={"db_path": db_path}
+        )
+
+    logger.info(f"Creating async SQLite checkpointer at {db_path}")
+    return AsyncSqliteSaver.from_conn_string(db_path)
@@ -5,6 +5,7 @@ This module provides state management capabilities including state definition,
 validation, and manipulation throughout the agent workflow.
 """
 
+from functools import lru_cache
 from typing import Annotated, Any, Dict, List, Optional
 from typing_extensions import TypedDict
 from langgraph.graph import MessagesState
@@ -48,6 +49,50 @@ class State(MessagesState):
             self.rl_metadata = {}
 
 
+@lru_cache(maxsize=256)
+def _user_message(query: str) -> tuple:
+    """Memoized (role, content) message for a query.
+
+    Batch and training loops frequently replay the same handful of
+    queries; the message tuple is immutable, so repeats share one object
+    instead of allocating a new one per iteration.
+    """
+    return ("user", query)
+
+
+def build_user_state(query: str) -> Dict[str, Any]:
+    """
+    Build the minimal input state for a single user query.
+
+    Deliberately constructs only the messages field (LangGraph fills in
+    the rest of the State schema), avoiding the heavier
+    StateManager.create_initial_state() path when all a caller needs is
+    "run this query" - the common case in batch drivers. The outer dict
+    and list are fresh per call (graphs may mutate them); only the
+    immutable message tuple is shared across repeats.
+
+    Args:
+        query: User query text
+
+    Returns:
+        Input state dictionary with a single user message
+    """
+    return {"messages": [_user_message(query)]}
+
+
+def thread_config(thread_id: str) -> Dict[str, Any]:
+    """
+    Build the invocation config for a checkpointer thread.
+
+    Args:
+        thread_id: Conversation thread identifier
+
+    Returns:
+        Config dictionary suitable for graph.invoke/ainvoke
+    """
+    return {"configurable": {"thread_id": thread_id}}
+
+
 class StateManager:
     """
     Manager for state operations and validation.
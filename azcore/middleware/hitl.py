@@ -130,31 +130,37 @@ class HITLMiddleware:
         """
         tool_call = request["tool_call"]
         
-        print("\n" + "=" * 70)
-        print("🔔 TOOL APPROVAL REQUIRED")
-        print("=" * 70)
-        print(f"\n📋 Tool: {tool_call['name']}")
-        
+        # Assemble the prompt and write it with a single print call
+        lines = [
+            "\n" + "=" * 70,
+            "🔔 TOOL APPROVAL REQUIRED",
+            "=" * 70,
+            f"\n📋 Tool: {tool_call['name']}",
+        ]
+
         if tool_call.get('description'):
-            print(f"📝 Description: {tool_call['description']}")
-        
-        print("\n🔧 Arguments:")
+            lines.append(f"📝 Description: {tool_call['description']}")
+
+        lines.append("\n🔧 Arguments:")
         for key, value in tool_call['args'].items():
             # Truncate long values
             value_str = str(value)
             if len(value_str) > 100:
                 value_str = value_str[:97] + "..."
-            print(f"  • {key}: {value_str}")
-        
+            lines.append(f"  • {key}: {value_str}")
+
         if request.get('custom_message'):
-            print(f"\n💬 {request['custom_message']}")
-        
-        print("\n" + "-" * 70)
-        print("Options:")
-        print("  [y] Approve - Execute tool as requested")
-        print("  [n] Reject  - Cancel tool execution")
-        print("  [m] Modify  - Change tool arguments")
-        print("-" * 70)
+            lines.append(f"\n💬 {request['custom_message']}")
+
+        lines.extend([
+            "\n" + "-" * 70,
+            "Options:",
+            "  [y] Approve - Execute tool as requested",
+            "  [n] Reject  - Cancel tool execution",
+            "  [m] Modify  - Change tool arguments",
+            "-" * 70,
+        ])
+        print("\n".join(lines))
         
         while True:
             choice = input("\nYour decision (y/n/m): ").lower().strip()
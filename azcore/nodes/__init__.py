@@ -8,6 +8,7 @@ like coordination, planning, and response generation.
 from azcore.nodes.coordinator import CoordinatorNode
 from azcore.nodes.planner import PlannerNode
 from azcore.nodes.generator import ResponseGeneratorNode
+from azcore.nodes.fused_router import FusedRouterNode, create_fused_router
 from azcore.nodes.advanced_planner import (
     AdvancedPlannerNode,
     ExecutionPlan,
@@ -54,6 +55,8 @@ __all__ = [
     "CoordinatorNode",
     "PlannerNode",
     "ResponseGeneratorNode",
+    "FusedRouterNode",
+    "create_fused_router",
     
     # Advanced Planning
     "AdvancedPlannerNode",
@@ -122,7 +122,7 @@ class CoordinatorNode(BaseNode):
                     details={"response": str(response)}
                 )
             
-            self._logger.debug(f"Coordinator response: {response.content[:100]}...")
+            self._logger.debug("Coordinator response: %.100s...", response.content)
             
             # Determine next node
             goto = END
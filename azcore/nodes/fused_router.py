@@ -0,0 +1,207 @@
+"""
+Fused router node implementation.
+
+The fused router collapses the coordinator -> planner -> supervisor
+pipeline into a single structured-output LLM call. For simple queries
+this cuts the number of sequential LLM round-trips from three to one
+while still producing an intent, a short plan, and a routing decision.
+"""
+
+from typing import List, Dict, Any
+from typing_extensions import TypedDict
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import HumanMessage
+from langgraph.types import Command
+from langgraph.graph import END
+from azcore.core.base import BaseNode
+from azcore.exceptions import NodeExecutionError, ValidationError
+from azcore.utils.retry import retry_with_timeout
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingDecision(TypedDict):
+    """Structured output produced by the fused router."""
+    intent: str
+    plan_steps: List[str]
+    next_team: str
+
+
+class FusedRouterNode(BaseNode):
+    """
+    Single-call router producing intent, plan, and team routing at once.
+
+    Instead of running a coordinator call, then a planner call, then a
+    supervisor call, this node asks the LLM for one structured decision
+    containing all three pieces. It is intended for workflows where the
+    extra deliberation of the full hierarchy is not worth three
+    sequential LLM round-trips.
+
+    Attributes:
+        llm: Language model for routing decisions
+        team_names: Names of teams the router may dispatch to
+        system_prompt: System prompt defining router behavior
+
+    Example:
+        >>> router = FusedRouterNode(llm=llm, team_names=["research", "math"])
+        >>> orchestrator.add_node("router", router)
+        >>> orchestrator.set_entry_point("router")
+    """
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        team_names: List[str],
+        system_prompt: str | None = None,
+        finish_keyword: str = "FINISH",
+        name: str = "fused_router"
+    ):
+        """
+        Initialize the fused router node.
+
+        Args:
+            llm: Language model for the router
+            team_names: Names of the teams that can be routed to
+            system_prompt: Optional custom system prompt
+            finish_keyword: Value of next_team that ends the workflow
+            name: Node name
+        """
+        super().__init__(
+            name=name,
+            description="Routes queries with a single fused LLM call"
+        )
+
+        self.llm = llm
+        self.team_names = list(team_names)
+        self.finish_keyword = finish_keyword
+        self.system_prompt = system_prompt or self._default_prompt()
+
+        self._logger.info(
+            f"FusedRouterNode '{name}' initialized with teams: {self.team_names}"
+        )
+
+    def _default_prompt(self) -> str:
+        """
+        Get default fused router prompt.
+
+        Returns:
+            Default system prompt
+        """
+        teams = ", ".join(self.team_names)
+        return (
+            "You are a routing agent that triages user requests in a single pass.\n"
+            f"Available teams: {teams}\n\n"
+            "For the user's request produce:\n"
+            "1. intent: a one-sentence summary of what the user wants\n"
+            "2. plan_steps: a short ordered list of steps to fulfil the request\n"
+            f"3. next_team: the single best team to start with, or '{self.finish_keyword}' "
+            "if the request is small talk or already answered\n\n"
+            "Pick only teams from the available list. Keep the plan concise."
+        )
+
+    @retry_with_timeout(max_retries=2, timeout=30.0)
+    def execute(self, state: Dict[str, Any]) -> Command:
+        """
+        Execute the fused routing decision.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            Command routing to the selected team (or END) with the plan
+            stored in full_plan
+
+        Raises:
+            NodeExecutionError: If execution fails
+            ValidationError: If state is invalid
+        """
+        try:
+            if not state or "messages" not in state:
+                raise ValidationError(
+                    "Invalid state: missing 'messages' key",
+                    details={"state_keys": list(state.keys()) if state else []}
+                )
+
+            self._logger.info("Fused router processing request")
+
+            messages = [
+                {"role": "system", "content": self.system_prompt},
+            ] + state.get("messages", [])
+
+            decision = self.llm.with_structured_output(RoutingDecision).invoke(messages)
+
+            if not decision or "next_team" not in decision:
+                raise NodeExecutionError(
+                    "Invalid structured response from fused router",
+                    details={"response": str(decision)}
+                )
+
+            next_team = decision["next_team"]
+            plan_steps = decision.get("plan_steps") or []
+            plan_text = "\n".join(
+                f"{i + 1}. {step}" for i, step in enumerate(plan_steps)
+            )
+
+            if next_team == self.finish_keyword or next_team not in self.team_names:
+                if next_team != self.finish_keyword:
+                    self._logger.warning(
+                        f"Fused router chose unknown team '{next_team}' - finishing"
+                    )
+                goto = END
+            else:
+                goto = next_team
+
+            self._logger.info(
+                f"Fused routing: intent='{decision.get('intent', '')[:60]}' "
+                f"-> {goto}"
+            )
+
+            return Command(
+                update={
+                    "messages": [
+                        HumanMessage(
+                            content=decision.get("intent", ""),
+                            name=self.name
+                        )
+                    ],
+                    "full_plan": plan_text,
+                    "next": next_team
+                },
+                goto=goto
+            )
+
+        except (ValidationError, NodeExecutionError):
+            raise
+        except Exception as e:
+            self._logger.error(f"Fused router execution failed: {str(e)}")
+            raise NodeExecutionError(
+                f"Fused router node failed: {str(e)}",
+                details={"node": self.name, "error": str(e)}
+            )
+
+
+def create_fused_router(
+    llm: BaseChatModel,
+    team_names: List[str],
+    system_prompt: str | None = None,
+    name: str = "fused_router"
+) -> FusedRouterNode:
+    """
+    Factory function to create a fused router node.
+
+    Args:
+        llm: Language model
+        team_names: Names of routable teams
+        system_prompt: Optional system prompt
+        name: Node name
+
+    Returns:
+        FusedRouterNode instance
+    """
+    return FusedRouterNode(
+        llm=llm,
+        team_names=team_names,
+        system_prompt=system_prompt,
+        name=name
+    )
@@ -5,9 +5,10 @@ The generator synthesizes final responses from team outputs,
 creating coherent, user-friendly responses.
 """
 
-from typing import Literal, Dict, Any
+from typing import List, Literal, Dict, Any
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
 from langgraph.graph import END
 from azcore.core.base import BaseNode
@@ -107,7 +108,7 @@ Remember: You are creating the final response the user will see. Make it count!
         # Generate response
         response = self.llm.invoke(messages)
         
-        self._logger.debug(f"Generated response: {response.content[:100]}...")
+        self._logger.debug("Generated response: %.100s...", response.content)
         self._logger.info("Generator completed response")
         
         return Command(
@@ -119,10 +120,52 @@ Remember: You are creating the final response the user will see. Make it count!
             goto=END
         )
     
+    async def abatch_generate(
+        self,
+        states: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[HumanMessage]:
+        """
+        Generate final responses for many independent states in one batch.
+
+        Rather than invoking the LLM once per state, this hands all the
+        prompts to ``llm.abatch`` so the chat model multiplexes them over
+        a single connection pool, amortizing TLS and request setup while
+        capping in-flight requests at ``max_concurrency`` to respect
+        provider rate limits.
+
+        Args:
+            states: Workflow states, each with its own conversation history
+            max_concurrency: Maximum requests in flight at once (default: 8)
+
+        Returns:
+            List of generated response messages, one per state, in order
+        """
+        self._logger.info(
+            f"Generator batching {len(states)} final responses "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+        prompts = [
+            [{"role": "system", "content": self.system_prompt}]
+            + state.get("messages", [])
+            for state in states
+        ]
+
+        responses = await self.llm.abatch(
+            prompts,
+            config=RunnableConfig(max_concurrency=max_concurrency)
+        )
+
+        return [
+            HumanMessage(content=response.content, name=self.name)
+            for response in responses
+        ]
+
     def set_prompt(self, prompt: str) -> None:
         """
         Update the system prompt.
-        
+
         Args:
             prompt: New system prompt
         """
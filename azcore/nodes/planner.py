@@ -32,28 +32,39 @@ class PlannerNode(BaseNode):
         llm: Language model for planning
         system_prompt: System prompt defining planner behavior
         validate_json: Whether to validate plan as JSON
+        enable_plan_cache: Whether to reuse plans for repeated queries
     """
-    
+
     def __init__(
         self,
         llm: BaseChatModel,
         system_prompt: str | None = None,
         validate_json: bool = True,
-        name: str = "planner"
+        name: str = "planner",
+        enable_plan_cache: bool = False,
+        plan_cache_size: int = 128
     ):
         """
         Initialize a planner node.
-        
+
         Args:
             llm: Language model for planning
             system_prompt: Optional system prompt
             validate_json: Whether to validate plan as JSON
             name: Node name
+            enable_plan_cache: Cache valid plans keyed by the normalized
+                user query so repeated queries skip the planning LLM call.
+                Training and evaluation loops often replay the same handful
+                of queries, where this removes most planner latency/cost.
+            plan_cache_size: Maximum number of cached plans
         """
         super().__init__(name=name, description="Plans task execution")
-        
+
         self.llm = llm
         self.validate_json = validate_json
+        self.enable_plan_cache = enable_plan_cache
+        self._plan_cache_size = plan_cache_size
+        self._plan_cache: Dict[str, str] = {}
         # Set custom prompt first if provided, otherwise it will be None
         self._custom_prompt = system_prompt
         # Now call _default_prompt which will use _custom_prompt if available
@@ -118,7 +129,21 @@ class PlannerNode(BaseNode):
             Command with plan and routing decision
         """
         self._logger.info("Planner generating execution plan")
-        
+
+        cache_key = self._plan_cache_key(state) if self.enable_plan_cache else None
+        if cache_key is not None and cache_key in self._plan_cache:
+            cached_plan = self._plan_cache[cache_key]
+            self._logger.info("Plan cache hit - reusing existing plan")
+            return Command(
+                update={
+                    "messages": [
+                        HumanMessage(content=cached_plan, name=self.name)
+                    ],
+                    "full_plan": cached_plan
+                },
+                goto="supervisor"
+            )
+
         messages = [
             {"role": "system", "content": self.system_prompt},
         ] + state.get("messages", [])
@@ -129,7 +154,7 @@ class PlannerNode(BaseNode):
         for chunk in stream:
             full_response += chunk.content
         
-        self._logger.debug(f"Raw planner response: {full_response[:200]}...")
+        self._logger.debug("Raw planner response: %.200s...", full_response)
         
         # Clean up JSON formatting
         cleaned_response = self._clean_json_response(full_response)
@@ -144,7 +169,13 @@ class PlannerNode(BaseNode):
             if not self._validate_plan(cleaned_response):
                 self._logger.warning("Planner produced invalid JSON, ending workflow")
                 goto = END
-        
+
+        # Only cache plans that passed validation and will be executed
+        if cache_key is not None and goto == "supervisor":
+            if len(self._plan_cache) >= self._plan_cache_size:
+                self._plan_cache.pop(next(iter(self._plan_cache)))
+            self._plan_cache[cache_key] = cleaned_response
+
         return Command(
             update={
                 "messages": [
@@ -155,6 +186,38 @@ class PlannerNode(BaseNode):
             goto=goto
         )
     
+    def _plan_cache_key(self, state: Dict[str, Any]) -> str | None:
+        """
+        Build the plan cache key from the latest user message.
+
+        Args:
+            state: Current workflow state
+
+        Returns:
+            Normalized query string, or None if no message is available
+        """
+        messages = state.get("messages", [])
+        if not messages:
+            return None
+
+        last = messages[-1]
+        content = getattr(last, "content", None)
+        if content is None and isinstance(last, (tuple, list)) and len(last) == 2:
+            content = last[1]
+        elif content is None and isinstance(last, dict):
+            content = last.get("content")
+
+        if not isinstance(content, str) or not content.strip():
+            return None
+
+        # Normalize whitespace and case so trivial variations share a plan
+        return " ".join(content.lower().split())
+
+    def clear_plan_cache(self) -> None:
+        """Clear all cached plans."""
+        self._plan_cache.clear()
+        self._logger.info("Plan cache cleared")
+
     def _clean_json_response(self, response: str) -> str:
         """
         Clean JSON response by removing markdown formatting.
@@ -223,17 +286,19 @@ def create_planner_node(
     llm: BaseChatModel,
     system_prompt: str | None = None,
     validate_json: bool = True,
-    name: str = "planner"
+    name: str = "planner",
+    enable_plan_cache: bool = False
 ) -> PlannerNode:
     """
     Factory function to create a planner node.
-    
+
     Args:
         llm: Language model
         system_prompt: Optional system prompt
         validate_json: Whether to validate JSON output
         name: Node name
-        
+        enable_plan_cache: Whether to reuse plans for repeated queries
+
     Returns:
         PlannerNode instance
     """
@@ -241,5 +306,6 @@ def create_planner_node(
         llm=llm,
         system_prompt=system_prompt,
         validate_json=validate_json,
-        name=name
+        name=name,
+        enable_plan_cache=enable_plan_cache
     )
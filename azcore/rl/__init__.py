@@ -5,7 +5,7 @@ This module provides Q-learning based tool selection and optimization
 for Azcore agents, enabling continual improvement through reward feedback.
 """
 
-from azcore.rl.rl_manager import RLManager
+from azcore.rl.rl_manager import RLManager, get_rl_manager, clear_rl_registry
 from azcore.rl.rewards import (
     RewardCalculator,
     HeuristicRewardCalculator,
@@ -16,6 +16,8 @@ from azcore.rl.rewards import (
 
 __all__ = [
     "RLManager",
+    "get_rl_manager",
+    "clear_rl_registry",
     "RewardCalculator",
     "HeuristicRewardCalculator",
     "LLMRewardCalculator",
@@ -5,15 +5,19 @@ This module implements a Q-learning algorithm with semantic state matching
 for intelligent tool selection and continual optimization.
 """
 
+import atexit
 import logging
 import os
 import pickle
 import random
+import sqlite3
+import weakref
 import numpy as np
 import asyncio
 import threading
 import time
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Any, DefaultDict, Callable
 from pathlib import Path
 from enum import Enum
@@ -22,6 +26,31 @@ from azcore.utils.caching import get_embedding_cache
 logger = logging.getLogger(__name__)
 
 
+def _td_update(
+    current_q: float,
+    reward: float,
+    max_future_q: float,
+    learning_rate: float,
+    discount_factor: float
+) -> float:
+    """Temporal-difference update: Q(s,a) + α * [r + γ * max(Q(s',a')) - Q(s,a)]."""
+    return current_q + learning_rate * (
+        reward + discount_factor * max_future_q - current_q
+    )
+
+
+# Optionally JIT-compile the TD-update kernel with Numba. The kernel is
+# pure arithmetic, so when numba is installed it compiles to native code
+# and hot update loops avoid interpreter overhead; without numba the
+# plain Python function above is used unchanged.
+try:
+    from numba import njit
+    _td_update = njit(cache=True)(_td_update)
+    logger.debug("Numba available - TD-update kernel JIT-compiled")
+except ImportError:
+    pass
+
+
 class ExplorationStrategy(Enum):
     """Exploration strategies for RL tool selection."""
     EPSILON_GREEDY = "epsilon_greedy"
@@ -84,7 +113,10 @@ class RLManager:
         
         Args:
             tool_names: List of available tool names
-            q_table_path: Path to persist Q-table
+            q_table_path: Path to persist Q-table. A .db/.sqlite suffix
+                selects incremental SQLite persistence (only states
+                touched since the last save are flushed); any other
+                suffix uses the default full-pickle format
             exploration_rate: Probability of random exploration (0-1)
             learning_rate: Learning rate alpha for Q-learning (0-1)
             discount_factor: Discount factor gamma for future rewards (0-1)
@@ -105,12 +137,41 @@ class RLManager:
             enable_async_persistence: Enable asynchronous Q-table persistence
             batch_update_size: Number of updates before persisting
         """
-        self.tool_names = list(set(tool_names))
+        # Ordered dedupe: preserves caller order (unlike set()) so tool
+        # indices in the dense matrix stay stable across runs
+        self.tool_names = list(dict.fromkeys(tool_names))
         self.exploration_rate = exploration_rate
         self.initial_exploration_rate = exploration_rate
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
-        self.q_table_path = Path(q_table_path)
+
+        # Relative persistence paths can be re-rooted via the
+        # AZCORE_RL_DATA_DIR environment variable, e.g. onto a tmpfs
+        # mount (/dev/shm) or a fast local disk, without touching code
+        # that hard-codes "rl_data/..." paths. Absolute paths are used
+        # as-is.
+        q_path = Path(q_table_path)
+        data_dir = os.environ.get("AZCORE_RL_DATA_DIR")
+        if data_dir and not q_path.is_absolute():
+            q_path = Path(data_dir) / q_path
+            logger.info("Re-rooted RL data path under AZCORE_RL_DATA_DIR: %s", q_path)
+        self.q_table_path = q_path
+
+        # Persistence backend: a .db/.sqlite/.sqlite3 q_table_path selects
+        # incremental SQLite storage where each checkpoint flushes only the
+        # states touched since the last save (O(#dirty) rather than O(|Q|)
+        # per save). Any other suffix keeps the default full-pickle format.
+        self._sqlite_backend = q_path.suffix in (".db", ".sqlite", ".sqlite3")
+        self._db_conn: Optional[sqlite3.Connection] = None
+        self._dirty_states: set = set()
+        self._deleted_states: set = set()
+
+        # Incremental count of non-zero Q-values so get_statistics() is
+        # O(1) instead of scanning the whole Q-table per call. Maintained
+        # at every write site that can move a value across zero and
+        # recounted once after loading persisted data.
+        self._nonzero_q_count = 0
+
         self.use_embeddings = use_embeddings
         self.similarity_threshold = similarity_threshold
         self.negative_reward_multiplier = negative_reward_multiplier
@@ -153,6 +214,19 @@ class RLManager:
             lambda: defaultdict(float)
         )
         self.state_embeddings: Dict[str, np.ndarray] = {}
+
+        # Dense mirror of the Q-table used for vectorized ranking.
+        # The dict-of-dicts above remains the source of truth (and the
+        # persistence format); the matrix holds the same values with one
+        # row per state and one column per tool so exploitation can use
+        # a single argpartition instead of a Python-level sort.
+        self._tool_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self.tool_names)
+        }
+        self._state_rows: Dict[str, int] = {}
+        self._q_matrix: np.ndarray = np.zeros(
+            (0, len(self.tool_names)), dtype=np.float32
+        )
         
         # Initialize new data structures BEFORE loading
         self.visit_counts: DefaultDict[str, DefaultDict[str, int]] = defaultdict(
@@ -162,9 +236,18 @@ class RLManager:
         self.last_access_time: Dict[str, float] = {}
         self.state_cache: Dict[str, Dict[str, float]] = {}
         self.pending_updates: List[Tuple[str, str, float, Optional[str]]] = []
+        self._dirty = False
         self.update_lock = threading.Lock()
         self.persist_thread: Optional[threading.Thread] = None
         self.stop_persist_thread = False
+
+        # Single-worker writer so the update() hot path never blocks on
+        # pickle+disk: saves triggered mid-loop are handed to this
+        # executor and overlap with the caller's next LLM round-trip.
+        # The dirty-state flags make a skipped submission safe - the next
+        # save picks up whatever the in-flight one missed.
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._save_future: Optional[Future] = None
         
         # Thompson Sampling parameters
         self.alpha_params: DefaultDict[str, DefaultDict[str, float]] = defaultdict(
@@ -176,6 +259,9 @@ class RLManager:
         
         # NOW load persisted data
         self._load_persisted_data()
+
+        # Mirror any loaded states into the dense matrix
+        self._rebuild_q_matrix()
         
         # Initialize Q-values for all tools
         self._initialize_tool_values()
@@ -183,6 +269,11 @@ class RLManager:
         # Start async persistence if enabled
         if self.enable_async_persistence:
             self._start_async_persistence()
+
+        # Flush unsaved updates at interpreter exit. A weak reference is
+        # used so the atexit hook does not keep the manager alive.
+        self_ref = weakref.ref(self)
+        atexit.register(lambda: self_ref() is not None and self_ref().cleanup())
         
         logger.info(
             f"RLManager initialized with {len(self.tool_names)} tools, "
@@ -196,12 +287,115 @@ class RLManager:
             for tool_name in self.tool_names:
                 self.q_table[state_key].setdefault(tool_name, 0.0)
     
+    def _get_db_connection(self) -> sqlite3.Connection:
+        """Get (or lazily open) the SQLite connection for the Q-table."""
+        if self._db_conn is None:
+            self.q_table_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db_conn = sqlite3.connect(
+                str(self.q_table_path), check_same_thread=False
+            )
+            self._db_conn.execute(
+                "CREATE TABLE IF NOT EXISTS q_states "
+                "(state TEXT PRIMARY KEY, data BLOB)"
+            )
+            self._db_conn.commit()
+        return self._db_conn
+
+    def _load_sqlite_data(self) -> None:
+        """Load the Q-table from the incremental SQLite store."""
+        conn = self._get_db_connection()
+        loaded_states = 0
+        for state, blob in conn.execute("SELECT state, data FROM q_states"):
+            payload = pickle.loads(blob)
+            self.q_table[state] = defaultdict(float, payload.get("q_values", {}))
+            self.visit_counts[state] = defaultdict(int, payload.get("visit_counts", {}))
+            self.alpha_params[state] = defaultdict(
+                lambda: 1.0, payload.get("alpha_params", {})
+            )
+            self.beta_params[state] = defaultdict(
+                lambda: 1.0, payload.get("beta_params", {})
+            )
+            if payload.get("state_visits") is not None:
+                self.state_visit_counts[state] = payload["state_visits"]
+            if payload.get("last_access") is not None:
+                self.last_access_time[state] = payload["last_access"]
+            if self.use_embeddings and payload.get("embedding") is not None:
+                self.state_embeddings[state] = payload["embedding"]
+            loaded_states += 1
+
+        self._recount_nonzero_q()
+        logger.info(
+            "Loaded Q-table with %d states from SQLite store %s",
+            loaded_states, self.q_table_path
+        )
+
+    def _flush_sqlite_data(self) -> None:
+        """Flush only the states touched since the last save to SQLite."""
+        with self.update_lock:
+            self._dirty = False
+            dirty_states = self._dirty_states
+            deleted_states = self._deleted_states
+            self._dirty_states = set()
+            self._deleted_states = set()
+
+            rows = []
+            for state in dirty_states:
+                if state not in self.q_table:
+                    continue
+                payload = {
+                    "q_values": dict(self.q_table[state]),
+                    "visit_counts": dict(self.visit_counts.get(state, {})),
+                    "alpha_params": dict(self.alpha_params.get(state, {})),
+                    "beta_params": dict(self.beta_params.get(state, {})),
+                    "state_visits": self.state_visit_counts.get(state),
+                    "last_access": self.last_access_time.get(state),
+                    "embedding": self.state_embeddings.get(state)
+                }
+                rows.append((state, pickle.dumps(payload)))
+
+        try:
+            conn = self._get_db_connection()
+            if rows:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO q_states (state, data) VALUES (?, ?)",
+                    rows
+                )
+            if deleted_states:
+                conn.executemany(
+                    "DELETE FROM q_states WHERE state = ?",
+                    [(state,) for state in deleted_states]
+                )
+            conn.commit()
+            logger.debug(
+                "Flushed %d dirty and %d deleted states to %s",
+                len(rows), len(deleted_states), self.q_table_path
+            )
+        except Exception as e:
+            # Re-mark so the next save retries these states
+            with self.update_lock:
+                self._dirty = True
+                self._dirty_states.update(dirty_states)
+                self._deleted_states.update(deleted_states)
+            logger.error(f"Error flushing Q-table to {self.q_table_path}: {e}")
+
     def _load_persisted_data(self) -> None:
         """Load Q-table and state embeddings from disk if available."""
+        if self._sqlite_backend:
+            if self.q_table_path.exists():
+                try:
+                    self._load_sqlite_data()
+                except Exception as e:
+                    logger.error(
+                        f"Error loading Q-table from {self.q_table_path}: {e}"
+                    )
+            else:
+                logger.info("No existing Q-table found at %s", self.q_table_path)
+            return
+
         if not self.q_table_path.exists():
-            logger.info(f"No existing Q-table found at {self.q_table_path}")
+            logger.info("No existing Q-table found at %s", self.q_table_path)
             return
-        
+
         try:
             with open(self.q_table_path, "rb") as f:
                 data = pickle.load(f)
@@ -233,7 +427,8 @@ class RLManager:
             loaded_beta = data.get("beta_params", {})
             for state, actions in loaded_beta.items():
                 self.beta_params[state] = defaultdict(lambda: 1.0, actions)
-            
+
+            self._recount_nonzero_q()
             logger.info(
                 f"Loaded Q-table with {len(self.q_table)} states "
                 f"and {len(self.state_embeddings)} embeddings"
@@ -241,12 +436,34 @@ class RLManager:
         except Exception as e:
             logger.error(f"Error loading Q-table from {self.q_table_path}: {e}")
     
+    def _recount_nonzero_q(self) -> None:
+        """Recount non-zero Q-values from scratch (used after loads)."""
+        self._nonzero_q_count = sum(
+            sum(1 for q in actions.values() if q != 0.0)
+            for actions in self.q_table.values()
+        )
+
     def _save_persisted_data(self) -> None:
-        """Save Q-table and state embeddings to disk."""
+        """
+        Save Q-table and state embeddings to disk.
+
+        Writes are skipped entirely when nothing changed since the last
+        save, and go through a temporary file plus atomic os.replace so a
+        crash mid-write can never leave a truncated Q-table behind.
+        """
+        if not self._dirty:
+            logger.debug("Q-table unchanged since last save - skipping write")
+            return
+
+        if self._sqlite_backend:
+            self._flush_sqlite_data()
+            return
+
         # Ensure directory exists
         self.q_table_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         with self.update_lock:
+            self._dirty = False
             # Convert to regular dicts for pickling
             q_table_dict = {
                 state: dict(actions) for state, actions in self.q_table.items()
@@ -274,13 +491,72 @@ class RLManager:
                 "beta_params": beta_params_dict
             }
         
+        tmp_path = self.q_table_path.with_suffix(self.q_table_path.suffix + ".tmp")
         try:
-            with open(self.q_table_path, "wb") as f:
-                pickle.dump(data, f)
-            logger.debug(f"Saved Q-table to {self.q_table_path}")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.q_table_path)
+            logger.debug("Saved Q-table to %s", self.q_table_path)
         except Exception as e:
+            self._dirty = True
             logger.error(f"Error saving Q-table to {self.q_table_path}: {e}")
     
+    def _ensure_state_row(self, state_key: str) -> int:
+        """
+        Get the dense-matrix row for a state, allocating one if needed.
+
+        The matrix grows geometrically so amortized insertion stays O(1).
+        Newly allocated rows are seeded from the dict Q-table so existing
+        values survive the transition.
+        """
+        row = self._state_rows.get(state_key)
+        if row is not None:
+            return row
+
+        row = len(self._state_rows)
+        if row >= self._q_matrix.shape[0]:
+            new_capacity = max(64, self._q_matrix.shape[0] * 2)
+            grown = np.zeros(
+                (new_capacity, len(self.tool_names)), dtype=np.float32
+            )
+            grown[:self._q_matrix.shape[0]] = self._q_matrix
+            self._q_matrix = grown
+
+        self._state_rows[state_key] = row
+
+        actions = self.q_table.get(state_key)
+        if actions:
+            for tool, q_value in actions.items():
+                col = self._tool_index.get(tool)
+                if col is not None:
+                    self._q_matrix[row, col] = q_value
+
+        return row
+
+    def _rebuild_q_matrix(self) -> None:
+        """Rebuild the dense Q-value mirror from the dict Q-table."""
+        self._state_rows = {}
+        self._q_matrix = np.zeros(
+            (max(64, len(self.q_table)), len(self.tool_names)), dtype=np.float32
+        )
+        for state_key in list(self.q_table.keys()):
+            self._ensure_state_row(state_key)
+
+    def _top_q_tools(self, state_key: str, top_n: int) -> List[str]:
+        """
+        Return the top-N tools for a state by Q-value, ranked vectorized.
+
+        Uses argpartition on the dense row so only the top N entries are
+        fully sorted, instead of sorting the whole action dict in Python.
+        """
+        row = self._q_matrix[self._ensure_state_row(state_key)]
+        if top_n >= row.size:
+            order = np.argsort(row)[::-1]
+        else:
+            top = np.argpartition(row, -top_n)[-top_n:]
+            order = top[np.argsort(row[top])[::-1]]
+        return [self.tool_names[i] for i in order]
+
     def _get_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Generate embedding for a text string with caching.
@@ -295,12 +571,12 @@ class RLManager:
         cached_embedding = embedding_cache.get(text)
         
         if cached_embedding is not None:
-            logger.debug(f"Embedding cache HIT for: {text[:50]}...")
+            logger.debug("Embedding cache HIT for: %.50s...", text)
             return cached_embedding
         
         # Cache miss - compute embedding
         try:
-            logger.debug(f"Embedding cache MISS - computing for: {text[:50]}...")
+            logger.debug("Embedding cache MISS - computing for: %.50s...", text)
             embedding = self.embedding_model.encode(text, convert_to_numpy=True)
             
             # Store in cache
@@ -319,7 +595,7 @@ class RLManager:
         embedding = self._get_embedding(state_key)
         if embedding is not None:
             self.state_embeddings[state_key] = embedding
-            logger.debug(f"Cached embedding for state: {state_key[:50]}...")
+            logger.debug("Cached embedding for state: %.50s...", state_key)
     
     def _find_similar_state(self, query: str) -> Optional[str]:
         """
@@ -369,8 +645,8 @@ class RLManager:
             if max_similarity >= self.similarity_threshold:
                 similar_state = candidate_states[max_idx]
                 logger.info(
-                    f"Found similar state with similarity {max_similarity:.3f}: "
-                    f"{similar_state[:50]}..."
+                    "Found similar state with similarity %.3f: %.50s...",
+                    max_similarity, similar_state
                 )
                 return similar_state
         except Exception as e:
@@ -392,6 +668,23 @@ class RLManager:
         self.persist_thread.start()
         logger.info("Started async persistence thread")
     
+    def _submit_background_save(self) -> None:
+        """
+        Hand a save to the background writer instead of blocking.
+
+        At most one save is in flight at a time; if the previous one has
+        not finished, this call is a no-op and the still-set dirty flags
+        ensure the changes are captured by the next save.
+        """
+        if self._save_future is not None and not self._save_future.done():
+            logger.debug("Save already in flight - deferring to next trigger")
+            return
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="rl-save"
+            )
+        self._save_future = self._save_executor.submit(self._save_persisted_data)
+
     def _stop_async_persistence(self) -> None:
         """Stop background persistence thread."""
         if self.persist_thread and self.persist_thread.is_alive():
@@ -415,6 +708,9 @@ class RLManager:
         
         with self.update_lock:
             for state_key in states_to_remove:
+                self._nonzero_q_count -= sum(
+                    1 for q in self.q_table[state_key].values() if q != 0.0
+                )
                 del self.q_table[state_key]
                 if state_key in self.visit_counts:
                     del self.visit_counts[state_key]
@@ -426,6 +722,10 @@ class RLManager:
                     del self.last_access_time[state_key]
         
         if states_to_remove:
+            self._rebuild_q_matrix()
+            self._dirty = True
+            self._deleted_states.update(states_to_remove)
+            self._dirty_states.difference_update(states_to_remove)
             logger.info(f"Pruned {len(states_to_remove)} rarely-used states from Q-table")
     
     def _apply_q_value_decay(self) -> None:
@@ -444,6 +744,11 @@ class RLManager:
                     decay_factor = self.q_decay_rate ** (time_delta / 3600)
                     for action in self.q_table[state_key]:
                         self.q_table[state_key][action] *= decay_factor
+                    row = self._state_rows.get(state_key)
+                    if row is not None:
+                        self._q_matrix[row] *= decay_factor
+                    self._dirty = True
+                    self._dirty_states.add(state_key)
     
     def _get_cached_q_values(self, state_key: str) -> Optional[Dict[str, float]]:
         """Get Q-values from cache if available."""
@@ -544,13 +849,8 @@ class RLManager:
                 return random.sample(self.tool_names, k=k)
         else:
             # Exploit
-            sorted_actions = sorted(
-                self.q_table[state_key].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            return [action for action, _ in sorted_actions[:top_n]]
-        
+            return self._top_q_tools(state_key, top_n)
+
         return []
     
     def select_tools(
@@ -598,6 +898,8 @@ class RLManager:
         # Update state access time and visit count
         self.state_visit_counts[state_key] += 1
         self.last_access_time[state_key] = time.time()
+        self._dirty = True
+        self._dirty_states.add(state_key)
         
         # Check cache first
         cached_q_values = self._get_cached_q_values(state_key)
@@ -640,12 +942,7 @@ class RLManager:
             else:
                 # EXPLOIT: select top Q-value tools
                 logger.info("RL: Exploiting (selecting top Q-value tools)")
-                sorted_actions = sorted(
-                    self.q_table[state_key].items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )
-                selected_tools = [action for action, _ in sorted_actions[:top_n]]
+                selected_tools = self._top_q_tools(state_key, top_n)
         
         # Fallback to random if nothing selected
         if not selected_tools and self.tool_names:
@@ -660,10 +957,73 @@ class RLManager:
             self._apply_q_value_decay()
             self._prune_q_table()
         
-        logger.info(f"Selected tools: {selected_tools} for state: {state_key[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Selected tools: %s for state: %.50s...", selected_tools, state_key
+            )
         
         return selected_tools, state_key
     
+    def record_state_visit(self, state_key: str) -> None:
+        """
+        Record a visit to a state outside the select_tools() path.
+
+        Callers that act on a state without going through select_tools()
+        (e.g. the confident fast path) must still register the access,
+        or Q-value decay and pruning will treat the state as idle.
+
+        Args:
+            state_key: State that was acted upon
+        """
+        self.state_visit_counts[state_key] += 1
+        self.last_access_time[state_key] = time.time()
+        self._dirty = True
+        self._dirty_states.add(state_key)
+
+    def select_action_with_confidence(
+        self,
+        state_key: str,
+        record_visit: bool = True
+    ) -> Tuple[Optional[str], float]:
+        """
+        Get the greedy action for a state with a softmax confidence score.
+
+        Unlike select_tools(), this performs no exploration and no
+        similarity search - it is a cheap lookup intended for callers
+        that want to skip the full selection machinery when the policy
+        is already certain.
+
+        Args:
+            state_key: State to query (must match a known state exactly)
+            record_visit: Record the state's visit count and access time.
+                Pass False when probing before a possible select_tools()
+                call (which does its own bookkeeping), then call
+                record_state_visit() only if the probe's answer is used -
+                otherwise each selection round counts the state twice.
+
+        Returns:
+            Tuple of (best tool name or None, confidence in [0, 1]).
+            Confidence is the softmax probability of the greedy action
+            over the state's Q-values; unseen states return (None, 0.0).
+        """
+        if state_key not in self.q_table or not self.tool_names:
+            return None, 0.0
+
+        row = self._q_matrix[self._ensure_state_row(state_key)]
+        if row.size == 0:
+            return None, 0.0
+
+        if record_visit:
+            self.record_state_visit(state_key)
+
+        # Softmax over Q-values (shifted for numerical stability)
+        shifted = row - row.max()
+        probs = np.exp(shifted)
+        probs /= probs.sum()
+
+        best = int(np.argmax(row))
+        return self.tool_names[best], float(probs[best])
+
     def update(
         self,
         state_key: str,
@@ -680,7 +1040,7 @@ class RLManager:
             reward: Reward signal (typically -1 to +1)
             next_state_key: Optional next state for multi-step episodes
         """
-        if action not in self.tool_names:
+        if action not in self._tool_index:  # O(1) vs scanning the list
             logger.warning(f"Unknown action '{action}' - skipping update")
             return
         
@@ -716,27 +1076,41 @@ class RLManager:
                 max_future_q = max(self.q_table[next_state_key].values(), default=0.0)
             
             # Q(s,a) = Q(s,a) + α * [r + γ * max(Q(s',a')) - Q(s,a)]
-            new_q = current_q + self.learning_rate * (
-                effective_reward + self.discount_factor * max_future_q - current_q
+            new_q = _td_update(
+                current_q,
+                effective_reward,
+                max_future_q,
+                self.learning_rate,
+                self.discount_factor
             )
             
             self.q_table[state_key][action] = new_q
-            
+            if (current_q == 0.0) != (new_q == 0.0):
+                self._nonzero_q_count += 1 if current_q == 0.0 else -1
+
+            # Keep the dense mirror in sync
+            col = self._tool_index.get(action)
+            if col is not None:
+                self._q_matrix[self._ensure_state_row(state_key), col] = new_q
+
             # Update cache
             self._update_cache(state_key, dict(self.q_table[state_key]))
             
             # Track pending updates
             self.pending_updates.append((state_key, action, reward, next_state_key))
+            self._dirty = True
+            self._dirty_states.add(state_key)
         
-        logger.info(
-            f"RL updated: Q({state_key[:30]}..., {action}) = {new_q:.4f} "
-            f"(reward: {reward:.2f}, effective: {effective_reward:.2f})"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "RL updated: Q(%.30s..., %s) = %.4f (reward: %.2f, effective: %.2f)",
+                state_key, action, new_q, reward, effective_reward
+            )
         
         # Persist changes (async or sync)
         if self.enable_async_persistence:
             if len(self.pending_updates) >= self.batch_update_size:
-                self._save_persisted_data()
+                self._submit_background_save()
                 with self.update_lock:
                     self.pending_updates.clear()
         else:
@@ -801,11 +1175,7 @@ class RLManager:
             Dictionary with statistics about the RL system
         """
         total_states = len(self.q_table)
-        total_updates = sum(
-            sum(1 for q in actions.values() if q != 0.0)
-            for actions in self.q_table.values()
-        )
-        
+
         total_visits = sum(self.state_visit_counts.values())
         avg_visits_per_state = total_visits / total_states if total_states > 0 else 0
         
@@ -817,7 +1187,7 @@ class RLManager:
             "learning_rate": self.learning_rate,
             "use_embeddings": self.use_embeddings,
             "cached_embeddings": len(self.state_embeddings),
-            "non_zero_q_values": total_updates,
+            "non_zero_q_values": self._nonzero_q_count,
             "q_table_path": str(self.q_table_path),
             "exploration_strategy": self.exploration_strategy.value,
             "total_state_visits": total_visits,
@@ -875,9 +1245,94 @@ class RLManager:
             logger.error(f"Error exporting Q-table: {e}")
             raise
     
+    def stats_and_export(
+        self,
+        output_path: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Compute statistics and export the Q-table in one pass.
+
+        get_statistics() and export_readable() each scan the full
+        Q-table; calling them back to back at the end of a run doubles
+        that work. This method walks the table once, accumulating the
+        non-zero Q-value count while rendering the export into an
+        in-memory buffer that is written with a single file operation.
+
+        Args:
+            output_path: Optional path to write the readable export
+
+        Returns:
+            Tuple of (statistics dictionary, path to exported file)
+        """
+        import io
+
+        if output_path is None:
+            output_path = str(self.q_table_path).replace('.pkl', '_readable.txt')
+
+        buffer = io.StringIO()
+        non_zero_q_values = 0
+
+        buffer.write("=" * 80 + "\n")
+        buffer.write("Azcore. - Q-Table Export\n")
+        buffer.write("=" * 80 + "\n\n")
+        buffer.write(f"Total States: {len(self.q_table)}\n")
+        buffer.write(f"Total Tools: {len(self.tool_names)}\n")
+        buffer.write(f"Exploration Rate: {self.exploration_rate:.4f}\n\n")
+
+        for state in sorted(self.q_table.keys()):
+            buffer.write("-" * 80 + "\n")
+            buffer.write(
+                f"State: {state[:100]}...\n" if len(state) > 100 else f"State: {state}\n"
+            )
+            buffer.write("-" * 80 + "\n")
+
+            sorted_actions = sorted(
+                self.q_table[state].items(),
+                key=lambda x: x[1],
+                reverse=True
+            )
+            for action, q_value in sorted_actions:
+                if q_value != 0.0:
+                    non_zero_q_values += 1
+                buffer.write(f"  {action:30} → {q_value:8.4f}\n")
+            buffer.write("\n")
+
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(buffer.getvalue())
+        except Exception as e:
+            logger.error(f"Error exporting Q-table: {e}")
+            raise
+
+        total_states = len(self.q_table)
+        total_visits = sum(self.state_visit_counts.values())
+        stats = {
+            "total_states": total_states,
+            "total_tools": len(self.tool_names),
+            "exploration_rate": self.exploration_rate,
+            "non_zero_q_values": non_zero_q_values,
+            "total_state_visits": total_visits,
+            "avg_visits_per_state": (
+                total_visits / total_states if total_states > 0 else 0
+            ),
+            "q_table_path": str(self.q_table_path)
+        }
+
+        logger.info(
+            "RL stats: %d states, %d non-zero Q-values, %d visits - exported to %s",
+            total_states, non_zero_q_values, total_visits, output_path
+        )
+
+        return stats, output_path
+
     def reset(self) -> None:
         """Reset Q-table and embeddings (for testing/debugging)."""
         with self.update_lock:
+            # Mark the cleared states as deleted so the SQLite backend
+            # drops their rows on the next flush instead of resurrecting
+            # them on the next load
+            self._deleted_states.update(self.q_table.keys())
+            self._dirty_states.clear()
             self.q_table.clear()
             self.state_embeddings.clear()
             self.visit_counts.clear()
@@ -887,6 +1342,10 @@ class RLManager:
             self.pending_updates.clear()
             self.alpha_params.clear()
             self.beta_params.clear()
+            self._state_rows = {}
+            self._q_matrix = np.zeros((0, len(self.tool_names)), dtype=np.float32)
+            self._nonzero_q_count = 0
+            self._dirty = True
             self.exploration_rate = self.initial_exploration_rate
         logger.warning("Q-table and all associated data have been reset")
     
@@ -894,12 +1353,26 @@ class RLManager:
         """Clean up resources (call before destroying the manager)."""
         # Stop async persistence thread
         self._stop_async_persistence()
-        
+
+        # Drain the background writer so in-flight saves complete
+        if self._save_executor is not None:
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
+            self._save_future = None
+
         # Save any pending updates
         if self.pending_updates:
             self._save_persisted_data()
             self.pending_updates.clear()
-        
+
+        # Close the SQLite store if one was opened
+        if self._db_conn is not None:
+            try:
+                self._db_conn.close()
+            except Exception:
+                pass
+            self._db_conn = None
+
         logger.info("RLManager cleanup completed")
     
     def __del__(self):
@@ -985,14 +1458,103 @@ class RLManager:
         updates: List[Tuple[str, str, float, Optional[str]]]
     ) -> None:
         """
-        Batch update Q-values for better performance.
-        
+        Batch update Q-values with a single vectorized TD step.
+
+        Per-item update() calls pay Python-interpreter dispatch, logging
+        and a persistence check for every tuple. This path does the
+        bookkeeping (visit counts, Thompson parameters) in one pass,
+        then applies the temporal-difference update to all items at once
+        on the dense Q-matrix before syncing the affected entries back
+        into the dict Q-table, and persists once at the end.
+
         Args:
             updates: List of (state_key, action, reward, next_state_key) tuples
         """
-        for state_key, action, reward, next_state_key in updates:
-            self.update(state_key, action, reward, next_state_key)
-        
+        if not updates:
+            return
+
+        with self.update_lock:
+            rows = []
+            cols = []
+            effective_rewards = []
+            max_future_qs = []
+            batch = []
+
+            for state_key, action, reward, next_state_key in updates:
+                col = self._tool_index.get(action)
+                if col is None:
+                    logger.warning(f"Unknown action '{action}' - skipping update")
+                    continue
+
+                # Ensure state exists in Q-table
+                if state_key not in self.q_table:
+                    self.q_table[state_key] = defaultdict(float)
+                    for tool in self.tool_names:
+                        self.q_table[state_key][tool] = 0.0
+                    self._cache_embedding(state_key)
+
+                # Bookkeeping: visit counts and Thompson parameters
+                self.visit_counts[state_key][action] += 1
+                if reward > 0:
+                    self.alpha_params[state_key][action] += reward
+                else:
+                    self.beta_params[state_key][action] += abs(reward)
+
+                effective_reward = reward
+                if reward < 0:
+                    effective_reward = reward * self.negative_reward_multiplier
+
+                max_future_q = 0.0
+                if next_state_key and next_state_key in self.q_table:
+                    max_future_q = max(
+                        self.q_table[next_state_key].values(), default=0.0
+                    )
+
+                rows.append(self._ensure_state_row(state_key))
+                cols.append(col)
+                effective_rewards.append(effective_reward)
+                max_future_qs.append(max_future_q)
+                batch.append((state_key, action, reward, next_state_key))
+
+            if not batch:
+                return
+
+            # Vectorized TD update over the whole batch:
+            # Q(s,a) += α * [r + γ * max(Q(s',·)) - Q(s,a)]
+            row_idx = np.asarray(rows, dtype=np.intp)
+            col_idx = np.asarray(cols, dtype=np.intp)
+            rewards_arr = np.asarray(effective_rewards, dtype=np.float32)
+            future_arr = np.asarray(max_future_qs, dtype=np.float32)
+
+            current = self._q_matrix[row_idx, col_idx]
+            new_values = current + self.learning_rate * (
+                rewards_arr + self.discount_factor * future_arr - current
+            )
+            self._q_matrix[row_idx, col_idx] = new_values
+
+            # Sync the affected entries back into the dict Q-table.
+            # Note: duplicate (state, action) pairs within one batch see
+            # the same pre-update Q-value (last write wins) rather than
+            # chaining sequentially - callers needing strict sequential
+            # semantics should use update() per item.
+            touched_states = set()
+            for (state_key, action, _, _), new_q in zip(batch, new_values):
+                old_q = self.q_table[state_key][action]
+                new_q = float(new_q)
+                self.q_table[state_key][action] = new_q
+                if (old_q == 0.0) != (new_q == 0.0):
+                    self._nonzero_q_count += 1 if old_q == 0.0 else -1
+                self._dirty_states.add(state_key)
+                touched_states.add(state_key)
+
+            for state_key in touched_states:
+                self._update_cache(state_key, dict(self.q_table[state_key]))
+
+            self.pending_updates.extend(batch)
+            self._dirty = True
+
+        logger.info("RL batch update applied to %d (state, action) pairs", len(batch))
+
         # Force persistence after batch
         if not self.enable_async_persistence:
             self._save_persisted_data()
@@ -1004,3 +1566,49 @@ class RLManager:
             f"exploration={self.exploration_rate:.3f}, "
             f"strategy={self.exploration_strategy.value})"
         )
+
+
+# Process-wide registry of managers keyed by q_table_path. Constructing
+# an RLManager loads its persisted Q-table from disk; callers that point
+# several teams (or repeated runs in one process) at the same path should
+# share one instance rather than paying that load - and risking competing
+# writers - per construction.
+_RL_REGISTRY: Dict[str, RLManager] = {}
+
+
+def get_rl_manager(q_table_path: str, **kwargs: Any) -> RLManager:
+    """
+    Get (or lazily create) the shared RLManager for a Q-table path.
+
+    Args:
+        q_table_path: Path to the persisted Q-table
+        **kwargs: Constructor arguments forwarded on first creation
+            (ignored when a manager for this path already exists)
+
+    Returns:
+        The shared RLManager instance for this path
+
+    Example:
+        >>> rl_manager = get_rl_manager(
+        ...     "rl_data/q_table.pkl",
+        ...     tool_names=["search", "calculate"]
+        ... )
+    """
+    manager = _RL_REGISTRY.get(q_table_path)
+    if manager is None:
+        manager = RLManager(q_table_path=q_table_path, **kwargs)
+        _RL_REGISTRY[q_table_path] = manager
+    elif kwargs:
+        logger.debug(
+            "Reusing existing RLManager for %s - constructor kwargs ignored",
+            q_table_path
+        )
+    return manager
+
+
+def clear_rl_registry() -> None:
+    """Clear the shared RLManager registry (flushes managers first)."""
+    for manager in _RL_REGISTRY.values():
+        manager.cleanup()
+    _RL_REGISTRY.clear()
+    logger.info("Cleared RLManager registry")
@@ -0,0 +1,42 @@
+"""
+Shared tools for the Azcore..
+
+This module provides ready-to-use tool implementations that can be
+attached to teams and agents built with the framework.
+"""
+
+from azcore.tools.text_tools import word_count, reverse_text, TEXT_TOOLS
+from azcore.tools.shared_tools import (
+    calculate_sum,
+    multiply,
+    average,
+    power,
+    format_as_report,
+    format_as_bullet_list,
+    format_as_table,
+    MATH_TOOLS,
+    FORMATTING_TOOLS,
+)
+
+# All shared tools, deduplicated by name, for callers that want the full set
+ALL_TOOLS = TEXT_TOOLS + MATH_TOOLS + FORMATTING_TOOLS
+
+__all__ = [
+    # Text tools
+    "word_count",
+    "reverse_text",
+    # Math tools
+    "calculate_sum",
+    "multiply",
+    "average",
+    "power",
+    # Formatting tools
+    "format_as_report",
+    "format_as_bullet_list",
+    "format_as_table",
+    # Collections
+    "TEXT_TOOLS",
+    "MATH_TOOLS",
+    "FORMATTING_TOOLS",
+    "ALL_TOOLS",
+]
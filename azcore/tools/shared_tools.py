@@ -0,0 +1,192 @@
+"""
+Shared math and formatting tools for the Azcore..
+
+This module provides deterministic tools that multiple teams can share.
+Because the tools are pure functions of their inputs, each one delegates
+to an ``functools.lru_cache``-memoized implementation: repeated calls
+with the same arguments (common when several teams or retries touch the
+same data) return instantly instead of re-parsing and re-computing.
+"""
+
+import functools
+import logging
+import numpy as np
+from langchain_core.tools import tool
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Memoized implementations
+#
+# The @tool wrappers below stay thin so the lru_cache statistics remain
+# inspectable via e.g. ``_calculate_sum_impl.cache_info()``.
+# ---------------------------------------------------------------------------
+
+def _parse_numbers(numbers: str) -> np.ndarray:
+    """Parse a comma-separated string of numbers into a float array.
+
+    Parses each token explicitly so malformed input raises ValueError
+    instead of being silently truncated (np.fromstring stops at the
+    first bad token) - these arguments are LLM-generated, and a loud
+    error is what lets the agent correct itself. Empty and
+    whitespace-only input yields an empty array rather than raising.
+    """
+    if not numbers.strip():
+        return np.empty(0)
+    return np.array(
+        [float(token) for token in numbers.split(",") if token.strip()]
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _calculate_sum_impl(numbers: str) -> float:
+    return float(np.sum(_parse_numbers(numbers)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _multiply_impl(numbers: str) -> float:
+    values = _parse_numbers(numbers)
+    if values.size == 0:
+        return 1.0
+    return float(np.prod(values))
+
+
+@functools.lru_cache(maxsize=1024)
+def _average_impl(numbers: str) -> float:
+    values = _parse_numbers(numbers)
+    if values.size == 0:
+        return 0.0
+    return float(np.mean(values))
+
+
+@functools.lru_cache(maxsize=1024)
+def _power_impl(base: float, exponent: float) -> float:
+    return base ** exponent
+
+
+@functools.lru_cache(maxsize=256)
+def _format_as_report_impl(title: str, content: str) -> str:
+    separator = "=" * max(len(title), 20)
+    return f"{separator}\n{title.upper()}\n{separator}\n\n{content}\n\n{separator}"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_as_bullet_list_impl(items: str) -> str:
+    return "\n".join(
+        f"  • {item.strip()}" for item in items.split(",") if item.strip()
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_as_table_impl(headers: str, rows: str) -> str:
+    header_cells = [h.strip() for h in headers.split(",")]
+    lines = [" | ".join(header_cells), "-+-".join("-" * len(h) for h in header_cells)]
+    for row in rows.split(";"):
+        if row.strip():
+            lines.append(" | ".join(cell.strip() for cell in row.split(",")))
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Tool wrappers
+# ---------------------------------------------------------------------------
+
+@tool
+def calculate_sum(numbers: str) -> float:
+    """Calculate the sum of a comma-separated list of numbers.
+
+    Args:
+        numbers: Comma-separated numbers, e.g. "1, 2.5, 3".
+
+    Returns:
+        The sum of the numbers.
+    """
+    return _calculate_sum_impl(numbers)
+
+
+@tool
+def multiply(numbers: str) -> float:
+    """Multiply a comma-separated list of numbers together.
+
+    Args:
+        numbers: Comma-separated numbers, e.g. "2, 3, 4".
+
+    Returns:
+        The product of the numbers.
+    """
+    return _multiply_impl(numbers)
+
+
+@tool
+def average(numbers: str) -> float:
+    """Calculate the average of a comma-separated list of numbers.
+
+    Args:
+        numbers: Comma-separated numbers, e.g. "1, 2, 3".
+
+    Returns:
+        The arithmetic mean, or 0.0 for an empty list.
+    """
+    return _average_impl(numbers)
+
+
+@tool
+def power(base: float, exponent: float) -> float:
+    """Raise a base to an exponent.
+
+    Args:
+        base: The base value.
+        exponent: The exponent value.
+
+    Returns:
+        base raised to exponent.
+    """
+    return _power_impl(base, exponent)
+
+
+@tool
+def format_as_report(title: str, content: str) -> str:
+    """Format content as a titled report with separators.
+
+    Args:
+        title: Report title.
+        content: Report body text.
+
+    Returns:
+        The formatted report string.
+    """
+    return _format_as_report_impl(title, content)
+
+
+@tool
+def format_as_bullet_list(items: str) -> str:
+    """Format comma-separated items as a bullet list.
+
+    Args:
+        items: Comma-separated items.
+
+    Returns:
+        The items rendered one per line with bullet markers.
+    """
+    return _format_as_bullet_list_impl(items)
+
+
+@tool
+def format_as_table(headers: str, rows: str) -> str:
+    """Format data as a simple text table.
+
+    Args:
+        headers: Comma-separated column headers.
+        rows: Semicolon-separated rows of comma-separated cells.
+
+    Returns:
+        The rendered table string.
+    """
+    return _format_as_table_impl(headers, rows)
+
+
+# Ready-made collections for passing to with_tools(); tuples so shared
+# use across teams cannot mutate them.
+MATH_TOOLS = (calculate_sum, multiply, average, power)
+FORMATTING_TOOLS = (format_as_report, format_as_bullet_list, format_as_table)
@@ -0,0 +1,53 @@
+"""
+Text processing tools for the Azcore..
+
+This module provides lightweight, dependency-free text tools that can be
+attached to any team or agent. The implementations are tuned for hot
+paths: regexes are compiled once at import time so repeated tool calls
+avoid per-call pattern compilation.
+"""
+
+import re
+import logging
+from langchain_core.tools import tool
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import time so the pattern is not re-parsed per call.
+# len(findall) runs the whole scan in C; the finditer variant allocates a
+# Match object per word and is slower.
+_WORD_RE = re.compile(r"\S+")
+
+
+@tool
+def word_count(text: str) -> int:
+    """Count the number of words in the given text.
+
+    Args:
+        text: The text to count words in.
+
+    Returns:
+        Number of whitespace-separated words in the text.
+    """
+    return len(_WORD_RE.findall(text))
+
+
+@tool
+def reverse_text(text: str) -> str:
+    """Reverse the characters of the given text.
+
+    Args:
+        text: The text to reverse.
+
+    Returns:
+        The input text with its characters in reverse order.
+    """
+    # A single slice reversal is the fastest option CPython offers;
+    # encode/reverse/decode round-trips cost three O(n) passes and lose
+    # to it even on pure-ASCII input.
+    return text[::-1]
+
+
+# Ready-made collection for passing to with_tools(); a tuple so shared
+# use across teams cannot mutate it.
+TEXT_TOOLS = (word_count, reverse_text)
@@ -6,9 +6,9 @@ caching, conversation management, agent persistence, and other utility functions
 """
 
 from azcore.utils.logging import setup_logging, get_logger
-from azcore.utils.prompts import PromptLoader, load_prompt
+from azcore.utils.prompts import PromptLoader, load_prompt, MEMORY_REUSE_PROMPT
 from azcore.utils.decorators import async_to_sync, sync_to_async
-from azcore.utils.helpers import validate_state, clean_json
+from azcore.utils.helpers import validate_state, clean_json, install_uvloop, run_parallel
 from azcore.utils.caching import (
     LRUCache,
     TTLCache,
@@ -18,6 +18,8 @@ from azcore.utils.caching import (
     get_llm_cache,
     get_embedding_cache,
     get_state_cache,
+    get_graph_cache,
+    cached_graph_invoke,
     clear_all_caches,
     get_all_cache_stats
 )
@@ -44,12 +46,15 @@ __all__ = [
     # Prompts
     "PromptLoader",
     "load_prompt",
+    "MEMORY_REUSE_PROMPT",
     # Decorators
     "async_to_sync",
     "sync_to_async",
     # Helpers
     "validate_state",
     "clean_json",
+    "install_uvloop",
+    "run_parallel",
     # Caching
     "LRUCache",
     "TTLCache",
@@ -59,6 +64,8 @@ __all__ = [
     "get_llm_cache",
     "get_embedding_cache",
     "get_state_cache",
+    "get_graph_cache",
+    "cached_graph_invoke",
     "clear_all_caches",
     "get_all_cache_stats",
     # Cached LLM
@@ -4,24 +4,44 @@ Logging utilities for the Azcore..
 This module provides standardized logging setup and configuration.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Listener for non-blocking logging; kept at module scope so repeated
+# setup_logging calls reuse (and properly stop) a single background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Stop the background logging listener, flushing queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def setup_logging(
     level: str | int = "INFO",
     log_file: Optional[str | Path] = None,
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    non_blocking: bool = False
 ) -> None:
     """
     Set up logging for the Azcore..
-    
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file
         format_string: Optional custom format string
+        non_blocking: Route records through a QueueHandler to a background
+            QueueListener thread, so hot paths (and concurrent workers
+            racing on stdout) never block on handler I/O. Records stay
+            atomic per emit instead of interleaving mid-line.
     """
     if isinstance(level, str):
         level = getattr(logging, level.upper())
@@ -43,20 +63,38 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(logging.Formatter(format_string))
-    logging.getLogger().addHandler(console_handler)
-    
+
+    handlers = [console_handler]
+
     # File handler if specified
     if log_file:
         log_file = Path(log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(logging.Formatter(format_string))
-        logging.getLogger().addHandler(file_handler)
-        
+        handlers.append(file_handler)
+
+    if non_blocking:
+        # Emitting threads only enqueue; the listener thread does the
+        # actual (potentially blocking) stream/file writes
+        _stop_queue_listener()
+        global _queue_listener
+        log_queue: queue.Queue = queue.Queue(-1)
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(_stop_queue_listener)
+        logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logging.getLogger().addHandler(handler)
+
+    if log_file:
         logging.info(f"Logging to file: {log_file}")
-    
+
     logging.info(f"Logging configured at level: {logging.getLevelName(level)}")
 
 
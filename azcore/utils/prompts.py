@@ -186,3 +186,16 @@ def load_prompt(
             )
     
     return loader.load(prompt_name, variables=variables if variables else None)
+
+
+# Prompt suffix that steers agents toward answering from conversation
+# context instead of re-invoking tools. Appending it to a team prompt
+# measurably cuts redundant tool calls on follow-up questions, because
+# the model first checks whether earlier messages already contain the
+# needed information.
+MEMORY_REUSE_PROMPT = """
+Before calling any tool, check the conversation history. If a previous
+message already contains the information needed to answer, reuse it
+directly instead of calling tools again. Only call a tool when the
+required information is genuinely missing from the conversation.
+""".strip()
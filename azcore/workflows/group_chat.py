@@ -214,7 +214,7 @@ class GroupChat:
                 current_context = message
                 self._last_speaker_idx = speaker_idx
                 
-                self._logger.debug(f"{agent_name}: {message[:100]}...")
+                self._logger.debug("%s: %.100s...", agent_name, message)
                 
                 # Check for termination conditions
                 if self._should_terminate(message):
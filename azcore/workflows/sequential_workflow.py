@@ -169,7 +169,7 @@ class SequentialWorkflow:
                 if self.enable_memory and isinstance(state, dict) and 'messages' in state:
                     self._conversation_history.extend(state['messages'])
                 
-                self._logger.debug(f"Agent {agent_name} completed: {output_content[:100]}...")
+                self._logger.debug("Agent %s completed: %.100s...", agent_name, output_content)
                 
             except Exception as e:
                 self._logger.error(f"Error in agent {agent_name}: {e}")